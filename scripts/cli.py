@@ -20,6 +20,10 @@ def create_parser() -> argparse.ArgumentParser:
     run_parser = subparsers.add_parser("run", help="Run benchmark tests")
     run_parser.add_argument("--test-plan", type=Path, required=True, help="Test plan file")
     run_parser.add_argument("--experiment-id", help="Experiment ID (auto-generated if not provided)")
+    run_parser.add_argument("--debug-artifacts", action="store_true",
+                            help="Save applied Kubernetes manifests to the experiment directory")
+    run_parser.add_argument("--skip-report", action="store_true",
+                            help="Skip HTML report generation (run 'report' later to generate it)")
 
     # Report command
     report_parser = subparsers.add_parser("report", help="Generate report")
@@ -4,12 +4,13 @@ Interactive Chart Generation with Plotly
 Creates interactive HTML charts for OMB results and infrastructure health metrics
 """
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from json_io import load_json
+
 try:
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
@@ -543,8 +544,7 @@ def generate_all_interactive_charts(
 
     # Load OMB results
     try:
-        with open(results_file, 'r') as f:
-            omb_results = json.load(f)
+        omb_results = load_json(results_file)
     except Exception as e:
         logger.error(f"Failed to load OMB results: {e}")
         return []
@@ -553,8 +553,7 @@ def generate_all_interactive_charts(
     health_metrics = None
     if health_metrics_file and health_metrics_file.exists():
         try:
-            with open(health_metrics_file, 'r') as f:
-                health_metrics = json.load(f)
+            health_metrics = load_json(health_metrics_file)
         except Exception as e:
             logger.warning(f"Failed to load health metrics: {e}")
 
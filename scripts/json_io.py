@@ -0,0 +1,45 @@
+"""
+JSON Helpers
+Shared JSON loading and encoding for result parsing, charts and reports
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+
+def loads(content: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or bytes.
+
+    NaN/Infinity literals (e.g. NaN Prometheus quantiles in metrics/plot_data.json)
+    are accepted.
+
+    Args:
+        content: Raw JSON text or bytes
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If content is not valid JSON
+    """
+    return json.loads(content)
+
+
+def load_json(path: Path) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed value
+    """
+    return loads(Path(path).read_bytes())
+
+
+def dumps_indented(data: Any) -> bytes:
+    """Encode data as 2-space indented UTF-8 JSON."""
+    return json.dumps(data, indent=2).encode('utf-8')
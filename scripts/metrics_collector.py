@@ -729,8 +729,9 @@ class MetricsCollector:
         # Save timeseries data
         if self.collected_metrics:
             timeseries_file = self.metrics_dir / "timeseries.json"
+            # Compact: machine-read and the largest metrics file, so skip pretty-printing
             with open(timeseries_file, 'w') as f:
-                json.dump(self.collected_metrics, f, indent=2)
+                json.dump(self.collected_metrics, f, separators=(',', ':'))
             logger.info(f"Timeseries metrics saved to: {timeseries_file} ({len(self.collected_metrics)} snapshots)")
 
         return self.collected_metrics
@@ -1257,8 +1258,9 @@ class MetricsCollector:
 
         # Save plot data
         plot_data_file = self.metrics_dir / "plot_data.json"
+        # Compact: only read back by the chart generators
         with open(plot_data_file, 'w') as f:
-            json.dump(plot_data, f, indent=2)
+            json.dump(plot_data, f, separators=(',', ':'))
 
         logger.info(f"Plot data exported to: {plot_data_file}")
         return plot_data
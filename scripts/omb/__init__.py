@@ -4,20 +4,34 @@ OpenMessaging Benchmark (OMB) management module.
 
 from .workers import WorkerManager
 from .manifests import ManifestBuilder, indent_yaml
-from .metrics import extract_avg_throughput, extract_current_rate_from_logs, format_rate_status
-from .plateau import check_plateau, generate_bash_plateau_check
+from .metrics import (
+    average_publish_rate,
+    extract_avg_throughput,
+    extract_current_rate_from_logs,
+    format_rate_status,
+    load_result_file,
+    parse_result_json,
+)
+from .plateau import PlateauTracker, check_plateau, generate_bash_plateau_check
 from .batch_script import render_batch_script
 from .batch_executor import BatchExecutor
+from .watch import JobStatusWatcher, PodLogTailer
 
 __all__ = [
     'WorkerManager',
     'ManifestBuilder',
     'indent_yaml',
+    'average_publish_rate',
     'extract_avg_throughput',
     'extract_current_rate_from_logs',
     'format_rate_status',
+    'load_result_file',
+    'parse_result_json',
+    'PlateauTracker',
     'check_plateau',
     'generate_bash_plateau_check',
     'render_batch_script',
     'BatchExecutor',
+    'JobStatusWatcher',
+    'PodLogTailer',
 ]
@@ -14,10 +14,14 @@ from typing import Callable, Dict, List, Tuple
 from rich.live import Live
 
 from .batch_script import render_batch_script
-from .metrics import extract_current_rate_from_logs, format_rate_status
+from .metrics import average_publish_rate, extract_current_rate_from_logs, format_rate_status, load_result_file
 
 logger = logging.getLogger(__name__)
 
+# Stage markers printed by the batch script
+_STAGE_COMPLETED_RE = re.compile(r'Stage (\S+) completed successfully')
+_STAGE_RE = re.compile(r'STAGE: (\S+)')
+
 
 class BatchExecutor:
     """
@@ -36,7 +40,8 @@ class BatchExecutor:
         manifest_builder,
         run_command_func: Callable,
         add_status_func: Callable,
-        create_layout_func: Callable
+        refresh_live_func: Callable,
+        debug_artifacts: bool = False
     ):
         self.experiment_id = experiment_id
         self.experiment_dir = experiment_dir
@@ -45,7 +50,15 @@ class BatchExecutor:
         self.manifest_builder = manifest_builder
         self.run_command = run_command_func
         self._add_status = add_status_func
-        self._create_layout = create_layout_func
+        self._refresh_live = refresh_live_func
+        self.debug_artifacts = debug_artifacts
+
+    def _apply_manifest(self, manifest: str, description: str, artifact_name: str) -> None:
+        """Apply a manifest via `kubectl apply -f -`, saving a copy when debug_artifacts is set."""
+        if self.debug_artifacts:
+            (self.experiment_dir / artifact_name).write_text(manifest)
+
+        self.run_command(["kubectl", "apply", "-f", "-"], description, input=manifest)
 
     def is_batch_compatible(self, test_plan: Dict) -> bool:
         """
@@ -150,8 +163,7 @@ class BatchExecutor:
                 )
 
                 if dest_path.exists():
-                    with open(dest_path, 'r') as f:
-                        data = json.load(f)
+                    data = load_result_file(dest_path)
                     results[stage_id] = {
                         'data': data,
                         'target_rate': target_rate
@@ -171,11 +183,41 @@ class BatchExecutor:
 
         return results
 
+    def _generate_report(self, test_plan: Dict) -> None:
+        """Generate the HTML report package from the collected stage results."""
+        try:
+            from report_generator import ReportGenerator, list_result_files
+            report_gen = ReportGenerator(self.experiment_dir, self.experiment_id)
+
+            results_dir = self.experiment_dir / "benchmark_results"
+            # Exclude _workload.json files (config files, not results)
+            result_files = list_result_files(results_dir)
+
+            if result_files:
+                report_config = {
+                    'test_plan': test_plan,
+                    'namespace': self.namespace,
+                    'experiment_id': self.experiment_id
+                }
+                report_gen.create_report_package(
+                    results_files=result_files,
+                    cost_data=None,
+                    config=report_config,
+                    include_raw_data=False,
+                )
+                self._add_status("Report generated", 'success')
+            else:
+                self._add_status("No result files found for report", 'warning')
+        except Exception as e:
+            logger.warning(f"Failed to generate report: {e}")
+            self._add_status(f"Report generation failed: {e}", 'warning')
+
     def run_batch_tests(
         self,
         test_plan: Dict,
         live: Live,
-        generate_workload_func: Callable
+        generate_workload_func: Callable,
+        generate_report: bool = True
     ) -> None:
         """
         Execute a test plan in batch mode.
@@ -197,46 +239,48 @@ class BatchExecutor:
         logger.info(f"Stages: {len(test_plan['test_runs'])}")
 
         self._add_status(f"Starting batch mode: {len(test_plan['test_runs'])} stages", 'info')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         # Step 1: Generate all workloads
         workloads = self.generate_batch_workloads(test_plan, generate_workload_func)
         self._add_status(f"Generated {len(workloads)} workload configurations", 'success')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         # Step 2: Create batch ConfigMap
         configmap_yaml = self.manifest_builder.build_batch_configmap(batch_name, workloads)
-        configmap_file = self.experiment_dir / f"batch_configmap_{batch_name}.yaml"
-        with open(configmap_file, 'w') as f:
-            f.write(configmap_yaml)
 
         self._add_status("Creating batch ConfigMap...", 'info')
-        live.update(self._create_layout())
-        self.run_command(
-            ["kubectl", "apply", "-f", str(configmap_file)],
-            f"Apply batch ConfigMap for {batch_name}"
+        self._refresh_live(live)
+        self._apply_manifest(
+            configmap_yaml,
+            f"Apply batch ConfigMap for {batch_name}",
+            f"batch_configmap_{batch_name}.yaml"
         )
         self._add_status("Batch ConfigMap created", 'success')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         # Step 3: Ensure workers (ONCE for entire batch)
         self._add_status(f"Ensuring {num_workers} workers are ready...", 'info')
-        live.update(self._create_layout())
+        self._refresh_live(live)
         try:
             self.worker_manager.ensure_workers(num_workers)
             self._add_status("Workers ready", 'success')
-            live.update(self._create_layout())
-
-            # Single grace period for worker warmup
-            self._add_status("Waiting 30s for workers to fully initialize...", 'info')
-            live.update(self._create_layout())
-            for i in range(30):
-                progress = (i + 1) / 30 * 100
-                self._add_status(f"Worker startup: {i+1}/30s ({progress:.0f}%)", 'info')
-                live.update(self._create_layout())
-                time.sleep(1)
-            self._add_status("Worker startup complete", 'success')
-            live.update(self._create_layout())
+            self._refresh_live(live)
+
+            # Single readiness wait for worker warmup (returns early when already Ready)
+            self._add_status("Waiting up to 30s for workers to become ready...", 'info')
+            self._refresh_live(live)
+
+            def show_progress(elapsed: float) -> None:
+                progress = min(elapsed, 30) / 30 * 100
+                self._add_status(f"Worker startup: {elapsed:.0f}/30s ({progress:.0f}%)", 'info')
+                self._refresh_live(live)
+
+            if self.worker_manager.wait_until_ready(num_workers, timeout=30, on_tick=show_progress):
+                self._add_status("Worker startup complete", 'success')
+            else:
+                self._add_status("Workers not all ready after 30s, continuing", 'warning')
+            self._refresh_live(live)
         except Exception as e:
             raise RuntimeError(f"Failed to ensure workers: {e}")
 
@@ -245,18 +289,16 @@ class BatchExecutor:
         workers_list = ",".join(worker_addresses)
         bash_script = render_batch_script(self.experiment_id, workers_list, plateau_config)
         job_yaml = self.manifest_builder.build_batch_job(batch_name, num_workers, bash_script)
-        job_file = self.experiment_dir / f"batch_job_{batch_name}.yaml"
-        with open(job_file, 'w') as f:
-            f.write(job_yaml)
 
         self._add_status("Starting batch Job...", 'info')
-        live.update(self._create_layout())
-        self.run_command(
-            ["kubectl", "apply", "-f", str(job_file)],
-            f"Create batch Job for {batch_name}"
+        self._refresh_live(live)
+        self._apply_manifest(
+            job_yaml,
+            f"Create batch Job for {batch_name}",
+            f"batch_job_{batch_name}.yaml"
         )
         self._add_status("Batch Job started", 'success')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         # Step 5: Monitor Job completion
         warmup_min = test_plan['base_workload'].get('warmup_duration_minutes', 1)
@@ -266,7 +308,7 @@ class BatchExecutor:
         timeout_seconds = total_expected_sec + (15 * 60)  # Add 15min buffer
 
         self._add_status(f"Monitoring batch Job (timeout: {timeout_seconds//60}min)...", 'info')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         start_time = time.time()
         stages_completed = 0
@@ -287,11 +329,11 @@ class BatchExecutor:
 
             if succeeded == '1':
                 self._add_status("Batch Job completed successfully", 'success')
-                live.update(self._create_layout())
+                self._refresh_live(live)
                 break
             elif failed == '1':
                 self._add_status("Batch Job failed", 'error')
-                live.update(self._create_layout())
+                self._refresh_live(live)
                 break
 
             # Try to get current stage from logs
@@ -308,13 +350,14 @@ class BatchExecutor:
                 logs = log_result.stdout
 
                 # Count COMPLETED stages
-                completed_matches = re.findall(r'Stage (\S+) completed successfully', logs)
+                completed_matches = _STAGE_COMPLETED_RE.findall(logs)
                 if completed_matches:
                     stages_completed = len(completed_matches)
 
-                # Check for currently running stage
-                current_stage_match = re.findall(r'STAGE: (\S+)', logs)
-                current_stage = current_stage_match[-1] if current_stage_match else None
+                # Check for currently running stage (only the last marker matters)
+                marker_pos = logs.rfind('STAGE: ')
+                current_stage_match = _STAGE_RE.match(logs, marker_pos) if marker_pos != -1 else None
+                current_stage = current_stage_match.group(1) if current_stage_match else None
 
                 # Extract current rate from logs
                 current_rate = extract_current_rate_from_logs(logs, current_stage)
@@ -322,12 +365,12 @@ class BatchExecutor:
                 # Check for plateau detection
                 if 'PLATEAU DETECTED' in logs:
                     self._add_status(f"Plateau detected at stage {stages_completed}", 'success')
-                    live.update(self._create_layout())
+                    self._refresh_live(live)
 
                 # Check if batch execution is complete
                 if 'BATCH EXECUTION COMPLETE' in logs:
                     self._add_status("Batch execution complete, collecting results...", 'success')
-                    live.update(self._create_layout())
+                    self._refresh_live(live)
                     break
             except Exception as e:
                 logger.debug(f"Error getting batch logs: {e}")
@@ -343,80 +386,48 @@ class BatchExecutor:
                     f"Running batch... {stages_completed}/{len(workloads)} completed",
                     'info'
                 )
-            live.update(self._create_layout())
+            self._refresh_live(live)
             time.sleep(10)
 
         # Step 6: Collect results
         self._add_status("Collecting batch results...", 'info')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         results = self.collect_batch_results(batch_name, workloads)
         self._add_status(f"Collected {len(results)} stage results", 'success')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         # Step 7: Generate report
-        self._add_status("Generating report...", 'info')
-        live.update(self._create_layout())
-
-        try:
-            from report_generator import ReportGenerator
-            report_gen = ReportGenerator(self.experiment_dir, self.experiment_id)
-
-            results_dir = self.experiment_dir / "benchmark_results"
-            # Exclude _workload.json files (config files, not results)
-            result_files = [
-                f for f in results_dir.glob("*.json")
-                if not f.name.endswith('_workload.json')
-            ]
-
-            if result_files:
-                report_config = {
-                    'test_plan': test_plan,
-                    'namespace': self.namespace,
-                    'experiment_id': self.experiment_id
-                }
-                report_gen.create_report_package(
-                    results_files=result_files,
-                    cost_data=None,
-                    config=report_config,
-                    include_raw_data=False,
-                )
-                self._add_status("Report generated", 'success')
-            else:
-                self._add_status("No result files found for report", 'warning')
-        except Exception as e:
-            logger.warning(f"Failed to generate report: {e}")
-            self._add_status(f"Report generation failed: {e}", 'warning')
-        live.update(self._create_layout())
+        if not generate_report or not results:
+            reason = "disabled" if not generate_report else "no stage produced results"
+            self._add_status(f"Report skipped ({reason})", 'warning')
+        else:
+            self._add_status("Generating report...", 'info')
+            self._refresh_live(live)
+            self._generate_report(test_plan)
+        self._refresh_live(live)
 
         # Step 8: Cleanup
         self._add_status("Cleaning up batch resources...", 'info')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         self.run_command(
-            ["kubectl", "delete", "job", f"omb-batch-{batch_name}",
+            ["kubectl", "delete", f"job/omb-batch-{batch_name}", f"configmap/omb-batch-{batch_name}",
              "-n", self.namespace, "--wait=false"],
-            f"Delete batch Job {batch_name}",
-            check=False
-        )
-        self.run_command(
-            ["kubectl", "delete", "configmap", f"omb-batch-{batch_name}",
-             "-n", self.namespace],
-            f"Delete batch ConfigMap {batch_name}",
-            check=False
+            f"Delete batch Job and ConfigMap {batch_name}",
+            check=False,
+            discard_stdout=True
         )
 
         self._add_status("Batch cleanup complete", 'success')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         # Log summary
         if results:
             throughputs = []
-            for stage_id, result_data in results.items():
-                data = result_data.get('data', {})
-                publish_rates = data.get('publishRate', [])
-                if publish_rates:
-                    avg = sum(publish_rates) / len(publish_rates)
+            for result_data in results.values():
+                avg = average_publish_rate(result_data.get('data', {}))
+                if avg is not None:
                     throughputs.append(avg)
 
             if throughputs:
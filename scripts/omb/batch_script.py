@@ -2,10 +2,11 @@
 Batch script generation - render Jinja2 template for batch mode execution.
 """
 
+import functools
 from pathlib import Path
 from typing import Dict
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from .plateau import generate_bash_plateau_check
 
@@ -13,6 +14,17 @@ from .plateau import generate_bash_plateau_check
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
 
+@functools.lru_cache(maxsize=None)
+def _get_batch_template() -> Template:
+    """Load and compile the batch runner template once per process (bytecode cached on disk)."""
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache()
+    )
+    return env.get_template("batch_runner.sh.j2")
+
+
 def render_batch_script(
     experiment_id: str,
     workers_list: str,
@@ -29,8 +41,7 @@ def render_batch_script(
     Returns:
         Rendered bash script string
     """
-    env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
-    template = env.get_template("batch_runner.sh.j2")
+    template = _get_batch_template()
 
     plateau_logic = generate_bash_plateau_check(plateau_config)
 
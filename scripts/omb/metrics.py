@@ -2,14 +2,36 @@
 OMB metrics extraction - parse throughput and rates from OMB output.
 """
 
-import json
 import logging
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+# Re-exported under the names callers of this module use
+from json_io import load_json as load_result_file, loads as parse_result_json
 
 logger = logging.getLogger(__name__)
 
+# Live driver output: "Pub rate 101926.1 msg/s / 49.8 MB/s | ..."
+_PUB_RATE_RE = re.compile(r'Pub rate\s+([\d.]+)\s+msg/s')
+
+
+def average_publish_rate(data: Dict) -> Optional[float]:
+    """
+    Average publish rate from an already-parsed OMB result.
+
+    Args:
+        data: OMB JSON result dictionary
+
+    Returns:
+        Average publish rate in msgs/sec, or None if no samples
+    """
+    # publishRate is an array of per-interval throughput values
+    publish_rates = data.get('publishRate', [])
+    if publish_rates:
+        return sum(publish_rates) / len(publish_rates)
+    return None
+
 
 def extract_avg_throughput(result_file: Path) -> Optional[float]:
     """
@@ -22,15 +44,7 @@ def extract_avg_throughput(result_file: Path) -> Optional[float]:
         Average publish rate in msgs/sec, or None if extraction fails
     """
     try:
-        with open(result_file, 'r') as f:
-            data = json.load(f)
-
-        # publishRate is an array of per-interval throughput values
-        publish_rates = data.get('publishRate', [])
-        if publish_rates:
-            avg_rate = sum(publish_rates) / len(publish_rates)
-            return avg_rate
-        return None
+        return average_publish_rate(load_result_file(result_file))
     except Exception as e:
         logger.warning(f"Failed to extract throughput from {result_file}: {e}")
         return None
@@ -57,10 +71,12 @@ def extract_current_rate_from_logs(logs: str, stage_id: Optional[str] = None) ->
         if marker_pos != -1:
             logs = logs[marker_pos:]
 
-    pattern = r'Pub rate\s+([\d.]+)\s+msg/s'
-    matches = re.findall(pattern, logs)
-    if matches:
-        return float(matches[-1])
+    # Only the most recent rate matters, so scan from the end and stop at the first hit
+    for line in reversed(logs.splitlines()):
+        if 'Pub rate' in line:
+            match = _PUB_RATE_RE.search(line)
+            if match:
+                return float(match.group(1))
     return None
 
 
@@ -9,25 +9,27 @@ def check_plateau(
     throughput_history: List[float],
     target_rates: List[float],
     allowed_deviation: float,
-    consecutive_fails_allowed: int
+    consecutive_fails_allowed: int,
+    min_steps: int = 0
 ) -> bool:
     """
     Check if throughput has plateaued based on deviation from target rate.
 
     A plateau is detected when the achieved throughput falls below the acceptable
     threshold (target * (1 - allowed_deviation/100)) for consecutive_fails_allowed
-    consecutive steps.
+    consecutive steps, once at least min_steps steps have run.
 
     Args:
         throughput_history: List of achieved throughput values (msgs/sec)
         target_rates: List of target rates corresponding to each throughput measurement
         allowed_deviation: Maximum allowed deviation percentage from target rate
         consecutive_fails_allowed: Number of consecutive steps with deviation before triggering plateau
+        min_steps: Warm-up guard - number of steps that must have run before a plateau can be reported
 
     Returns:
         True if plateau detected, False otherwise
     """
-    if len(throughput_history) < consecutive_fails_allowed:
+    if len(throughput_history) < max(consecutive_fails_allowed, min_steps):
         return False
 
     if len(throughput_history) != len(target_rates):
@@ -54,6 +56,63 @@ def check_plateau(
     return True
 
 
+class PlateauTracker:
+    """
+    Streaming equivalent of check_plateau().
+
+    Keeps a running count of consecutive deviating steps plus the best throughput seen,
+    so each step is O(1) and no history lists need to be kept.
+    """
+
+    def __init__(self, allowed_deviation: float, consecutive_fails_allowed: int, min_steps: int = 0):
+        """
+        Initialize tracker.
+
+        Args:
+            allowed_deviation: Maximum allowed deviation percentage from target rate
+            consecutive_fails_allowed: Number of consecutive steps with deviation before triggering plateau
+            min_steps: Warm-up guard - number of steps that must have run before a plateau can be reported
+        """
+        self.allowed_deviation = allowed_deviation
+        self.consecutive_fails_allowed = consecutive_fails_allowed
+        self.min_steps = min_steps
+        self.steps = 0
+        self.consecutive_fails = 0
+        self.max_throughput = 0.0
+        self.max_throughput_step = ""
+
+    def update(self, step_name: str, throughput: float, target_rate: float) -> bool:
+        """
+        Record one step's result.
+
+        Args:
+            step_name: Name of the test step
+            throughput: Achieved throughput (msgs/sec)
+            target_rate: Target rate for the step (msgs/sec)
+
+        Returns:
+            True if a plateau is detected after this step, False otherwise
+        """
+        self.steps += 1
+        if throughput > self.max_throughput:
+            self.max_throughput = throughput
+            self.max_throughput_step = step_name
+
+        if target_rate <= 0:
+            # Invalid target rate breaks the streak, as in check_plateau()
+            self.consecutive_fails = 0
+            return False
+
+        min_acceptable = target_rate * (1 - self.allowed_deviation / 100)
+        if throughput >= min_acceptable:
+            self.consecutive_fails = 0
+        else:
+            self.consecutive_fails += 1
+
+        return (self.consecutive_fails >= self.consecutive_fails_allowed
+                and self.steps >= self.min_steps)
+
+
 def generate_bash_plateau_check(plateau_config: Dict) -> str:
     """
     Generate bash code for plateau detection.
@@ -63,6 +122,7 @@ def generate_bash_plateau_check(plateau_config: Dict) -> str:
 
     Args:
         plateau_config: Dict with 'enabled', 'allowed_deviation', 'consecutive_fails_allowed'
+            and optional 'min_steps'
 
     Returns:
         Bash code snippet for plateau detection, or empty string if disabled
@@ -72,10 +132,12 @@ def generate_bash_plateau_check(plateau_config: Dict) -> str:
 
     allowed_deviation = plateau_config.get('allowed_deviation', 10.0)
     consecutive_required = plateau_config.get('consecutive_fails_allowed', 2)
+    # Warm-up guard: no detection before this many stages have run
+    min_stages = max(consecutive_required, plateau_config.get('min_steps', 0))
 
     return f'''
     # PLATEAU DETECTION (compare achieved vs target rate)
-    if [ $stage_count -ge {consecutive_required} ]; then
+    if [ $stage_count -ge {min_stages} ]; then
       # Check if last N steps all deviated from target by more than {allowed_deviation}%
       all_deviated=true
       for ((i=0; i<{consecutive_required}; i++)); do
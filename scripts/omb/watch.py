@@ -0,0 +1,251 @@
+"""
+Streaming Kubernetes watches for OMB Jobs.
+
+Long-lived `kubectl get -w` / `kubectl logs -f` processes replace repeated one-shot
+kubectl calls in poll loops, so each tick reads an in-memory cache instead of paying
+for a kubectl startup and apiserver round trip.
+"""
+
+import logging
+import subprocess
+import threading
+from typing import Optional, Tuple
+
+from .metrics import extract_current_rate_from_logs
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatusWatcher:
+    """
+    Watches a Job's succeeded/failed/active counts in a background thread.
+
+    Usage:
+        with JobStatusWatcher("omb-test", "omb") as watcher:
+            counts = watcher.counts()  # None until the first event arrives
+    """
+
+    JSONPATH = '{.status.succeeded}|{.status.failed}|{.status.active}{"\\n"}'
+    RESTART_DELAY_SECONDS = 2
+
+    def __init__(self, job_name: str, namespace: str):
+        """
+        Initialize the watcher.
+
+        Args:
+            job_name: Name of the Kubernetes Job to watch
+            namespace: Kubernetes namespace of the Job
+        """
+        self.job_name = job_name
+        self.namespace = namespace
+        self.changed = threading.Event()
+
+        self._lock = threading.Lock()
+        self._counts: Optional[Tuple[int, int, int]] = None
+        self._stopped = threading.Event()
+        # Guards _process so stop() can't miss a kubectl process started concurrently
+        self._process_lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "JobStatusWatcher":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def start(self) -> "JobStatusWatcher":
+        """Start the background watch thread."""
+        self._thread = threading.Thread(target=self._run, name=f"watch-{self.job_name}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the watch and terminate the kubectl process."""
+        self._stopped.set()
+        with self._process_lock:
+            process = self._process
+        if process and process.poll() is None:
+            process.terminate()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def counts(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Latest (succeeded, failed, active) counts seen on the watch.
+
+        Returns:
+            Counts tuple, or None if no event has arrived or the watch is not running
+            (callers should fall back to a direct `kubectl get`)
+        """
+        with self._lock:
+            return self._counts
+
+    def _run(self) -> None:
+        """Run `kubectl get -w`, restarting it if the apiserver closes the watch."""
+        while not self._stopped.is_set():
+            try:
+                process = self._spawn()
+                if process is None:
+                    break
+                for line in process.stdout:
+                    self._update(line)
+                process.wait()
+            except Exception as e:
+                logger.debug(f"Job watch for {self.job_name} failed: {e}")
+
+            with self._lock:
+                self._counts = None
+            self._stopped.wait(self.RESTART_DELAY_SECONDS)
+
+    def _spawn(self) -> Optional[subprocess.Popen]:
+        """
+        Start `kubectl get -w` unless the watcher has been stopped.
+
+        Checking _stopped and assigning _process under the lock means a concurrent
+        stop() either prevents the start or sees (and terminates) the new process.
+        """
+        with self._process_lock:
+            if self._stopped.is_set():
+                return None
+            self._process = subprocess.Popen(
+                ["kubectl", "get", "job", self.job_name, "-n", self.namespace,
+                 "-w", "-o", f"jsonpath={self.JSONPATH}"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+            return self._process
+
+    def _update(self, line: str) -> None:
+        """Parse one 'succeeded|failed|active' line from the watch stream."""
+        fields = line.strip().split("|")
+        if len(fields) != 3:
+            return
+        try:
+            counts = tuple(int(x or 0) for x in fields)
+        except ValueError:
+            return
+
+        with self._lock:
+            previous = self._counts
+            self._counts = counts
+        if counts != previous:
+            self.changed.set()
+
+
+class PodLogTailer:
+    """
+    Follows a pod's logs in a background thread.
+
+    Tracks the most recent OMB publish rate and flags the driver's results-collection
+    sleep message as soon as it is printed, so it cannot scroll out between polls.
+    """
+
+    SLEEP_MESSAGE = "seconds to allow results collection"
+    RESTART_DELAY_SECONDS = 2
+    TERMINAL_PHASES = ("Succeeded", "Failed")
+
+    def __init__(self, pod_name: str, namespace: str):
+        """
+        Initialize the tailer.
+
+        Args:
+            pod_name: Name of the pod to follow
+            namespace: Kubernetes namespace of the pod
+        """
+        self.pod_name = pod_name
+        self.namespace = namespace
+        self.sleep_detected = threading.Event()
+        self.latest_rate: Optional[float] = None
+        self.failed = False
+
+        self._stopped = threading.Event()
+        # Guards _process so stop() can't miss a kubectl process started concurrently
+        self._process_lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PodLogTailer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def start(self) -> "PodLogTailer":
+        """Start the background log-follow thread."""
+        self._thread = threading.Thread(target=self._run, name=f"logs-{self.pod_name}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop following and terminate the kubectl process."""
+        self._stopped.set()
+        with self._process_lock:
+            process = self._process
+        if process and process.poll() is None:
+            process.terminate()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        """
+        Run `kubectl logs -f`, reconnecting if the stream drops while the pod runs.
+
+        The stream ends for good once kubectl exits cleanly (the container finished)
+        or the pod has reached a terminal phase.
+        """
+        while not self._stopped.is_set():
+            try:
+                process = self._spawn()
+                if process is None:
+                    break
+                for line in process.stdout:
+                    self._handle_line(line)
+                if process.wait() == 0 or self._pod_finished():
+                    break
+                self.failed = not self._stopped.is_set()
+            except Exception as e:
+                logger.debug(f"Log stream for {self.pod_name} failed: {e}")
+                self.failed = True
+
+            self._stopped.wait(self.RESTART_DELAY_SECONDS)
+
+    def _spawn(self) -> Optional[subprocess.Popen]:
+        """
+        Start `kubectl logs -f` unless the tailer has been stopped.
+
+        Checking _stopped and assigning _process under the lock means a concurrent
+        stop() either prevents the start or sees (and terminates) the new process.
+        """
+        with self._process_lock:
+            if self._stopped.is_set():
+                return None
+            self._process = subprocess.Popen(
+                ["kubectl", "logs", "-f", self.pod_name, "-n", self.namespace, "--tail=50"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            )
+            return self._process
+
+    def _pod_finished(self) -> bool:
+        """Whether the pod has reached a terminal phase (False if it can't be read)."""
+        result = subprocess.run(
+            ["kubectl", "get", "pod", self.pod_name, "-n", self.namespace,
+             "-o", "jsonpath={.status.phase}"],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=30
+        )
+        return result.returncode == 0 and result.stdout.strip() in self.TERMINAL_PHASES
+
+    def _handle_line(self, line: str) -> None:
+        """Update the latest rate and sleep flag from one log line."""
+        self.failed = False
+        rate = extract_current_rate_from_logs(line)
+        if rate is not None:
+            self.latest_rate = rate
+        if self.SLEEP_MESSAGE in line:
+            self.sleep_detected.set()
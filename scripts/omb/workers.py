@@ -2,12 +2,11 @@
 OMB Worker management - persistent workers across test runs.
 """
 
-import json
 import logging
 import subprocess
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -85,8 +84,7 @@ class WorkerManager:
         manifest = self._generate_worker_manifests(count)
         manifest_file = self.results_dir / "omb-workers.yaml"
 
-        with open(manifest_file, 'w') as f:
-            f.write(manifest)
+        manifest_file.write_text(manifest)
 
         # Apply manifests
         subprocess.run(
@@ -119,40 +117,95 @@ class WorkerManager:
         start_time = time.time()
 
         while time.time() - start_time < timeout_seconds:
-            result = subprocess.run(
-                ["kubectl", "get", "pods", "-n", self.namespace,
-                 "-l", f"app=omb-worker",
-                 "-o", "json"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-
-            if result.returncode == 0:
-                pods = json.loads(result.stdout)
-                pod_items = pods.get('items', [])
+            readiness = self._get_pod_readiness()
 
-                if len(pod_items) == expected_count:
+            if readiness is not None:
+                if len(readiness) == expected_count:
                     # Check if all are ready
-                    ready_count = 0
-                    for pod in pod_items:
-                        conditions = pod.get('status', {}).get('conditions', [])
-                        for condition in conditions:
-                            if condition['type'] == 'Ready' and condition['status'] == 'True':
-                                ready_count += 1
-                                break
+                    ready_count = sum(readiness.values())
 
                     if ready_count == expected_count:
                         return
                     else:
                         logger.debug(f"Workers ready: {ready_count}/{expected_count}")
                 else:
-                    logger.debug(f"Workers created: {len(pod_items)}/{expected_count}")
+                    logger.debug(f"Workers created: {len(readiness)}/{expected_count}")
 
             time.sleep(5)
 
         raise TimeoutError(f"Timeout waiting for {expected_count} workers to be ready")
 
+    def wait_until_ready(
+        self,
+        num_workers: int,
+        timeout: int = 30,
+        on_tick: Optional[Callable[[float], None]] = None
+    ) -> bool:
+        """
+        Wait until the first num_workers worker pods report Ready.
+
+        The worker readiness probe is a TCP check on the HTTP port, so Ready means the
+        JVM is up and accepting connections. Returns immediately when persistent workers
+        from a previous test are already Ready.
+
+        Args:
+            num_workers: Number of workers that must be Ready
+            timeout: Maximum seconds to wait
+            on_tick: Optional callback invoked with elapsed seconds on each check
+
+        Returns:
+            True if all workers became Ready within timeout, False otherwise
+        """
+        required = {f"{self.STATEFULSET_NAME}-{i}" for i in range(num_workers)}
+        start_time = time.time()
+
+        while True:
+            elapsed = time.time() - start_time
+            if on_tick:
+                on_tick(elapsed)
+
+            readiness = self._get_pod_readiness()
+
+            if readiness is not None:
+                ready = {name for name, is_ready in readiness.items() if is_ready}
+                if required <= ready:
+                    return True
+                logger.debug(f"Workers ready: {len(required & ready)}/{num_workers}")
+
+            if elapsed >= timeout:
+                logger.warning(f"Workers not all Ready after {timeout}s, continuing")
+                return False
+
+            time.sleep(1)
+
+    def _get_pod_readiness(self) -> Optional[Dict[str, bool]]:
+        """
+        Get the Ready condition of each worker pod.
+
+        Uses a jsonpath projection so only pod names and Ready statuses are transferred
+        and parsed, not the full pod objects.
+
+        Returns:
+            Mapping of pod name to readiness, or None if the pods could not be listed
+        """
+        result = subprocess.run(
+            ["kubectl", "get", "pods", "-n", self.namespace,
+             "-l", "app=omb-worker",
+             "-o", 'jsonpath={range .items[*]}{.metadata.name}={.status.conditions[?(@.type=="Ready")].status}{"\\n"}{end}'],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode != 0:
+            return None
+
+        readiness = {}
+        for line in result.stdout.splitlines():
+            name, _, status = line.partition("=")
+            if name:
+                readiness[name] = status == "True"
+        return readiness
+
     def cleanup_workers(self) -> None:
         """Delete the worker StatefulSet and Service."""
         logger.info("Cleaning up workers...")
@@ -5,7 +5,6 @@ Creates interactive synchronized charts from OpenMessaging Benchmark results usi
 All charts share synchronized zoom/pan for easy correlation analysis.
 """
 
-import json
 import logging
 import math
 from itertools import chain
@@ -13,6 +12,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 import uuid
 
+from json_io import load_json
+
 try:
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
@@ -38,8 +39,7 @@ def load_results(result_files: List[Path]) -> Dict[str, List[Dict]]:
 
     for result_file in result_files:
         try:
-            with open(result_file, 'r') as f:
-                result = json.load(f)
+            result = load_json(result_file)
 
             # Add legend/label for this result
             result['legend'] = result.get('workload', result_file.stem)
@@ -4,12 +4,17 @@ Handles cleanup operations for workers, topics, and namespaces.
 """
 
 import logging
+import os
+import shlex
+import signal
 import subprocess
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
 from dataclasses import dataclass
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
@@ -55,24 +60,12 @@ def cleanup_pulsar_topics(namespace: str, pulsar_namespace: str) -> None:
 
     logger.info(f"Found {len(topics)} topic(s) to delete")
 
-    # Delete each topic
-    deleted = 0
-    failed = 0
+    # Delete all topics through a single exec into the broker pod
+    def log_failure(topic: str, success: bool, reason: str) -> None:
+        if not success:
+            logger.warning(f"Failed to delete topic {topic}: {reason or 'unknown error'}")
 
-    for topic in topics:
-        delete_result = subprocess.run(
-            ["kubectl", "exec", "-n", namespace, "pulsar-broker-0", "--",
-             "bin/pulsar-admin", "topics", "delete", topic, "-f"],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
-        if delete_result.returncode == 0:
-            deleted += 1
-        else:
-            failed += 1
-            logger.warning(f"Failed to delete topic {topic}: {delete_result.stderr}")
+    deleted, failed = bulk_delete_topics(topics, k8s_namespace=namespace, on_result=log_failure)
 
     logger.info(f"✓ Cleaned up {deleted}/{len(topics)} topics")
     if failed > 0:
@@ -87,144 +80,369 @@ class NamespaceDeleteResult:
     topics_deleted: int
     topics_failed: int
     error: str = ""
+    forced: bool = False
 
 
-def _delete_single_topic(topic_info: Tuple[str, str]) -> bool:
+class PulsarAdminSession:
     """
-    Delete a single topic.
-
-    Args:
-        topic_info: Tuple of (topic_type, topic_name) where topic_type is 'regular' or 'partitioned'
+    Long-lived shell in the broker pod for issuing pulsar-admin commands.
 
-    Returns:
-        True if deletion succeeded, False otherwise
+    Commands are written to the shell's stdin and framed with a sentinel line
+    carrying the exit code, so a sequence of admin calls shares one kubectl exec
+    instead of paying exec setup for each call. Not thread-safe: use one
+    session per thread.
     """
-    topic_type, topic = topic_info
 
-    if topic_type == 'regular':
-        result = subprocess.run(
-            ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-             "bin/pulsar-admin", "topics", "delete", topic, "-f"],
-            capture_output=True,
+    SENTINEL = "__PULSAR_ADMIN_DONE__"
+    STDERR_TAIL_LINES = 20
+
+    def __init__(
+        self,
+        k8s_namespace: str = "pulsar",
+        pod_name: str = "pulsar-broker-0",
+        timeout: int = 300
+    ):
+        """
+        Initialize session (the shell is started on __enter__).
+
+        Args:
+            k8s_namespace: Kubernetes namespace of the broker pod
+            pod_name: Broker pod to exec into
+            timeout: Default seconds to wait for each command before killing the session
+        """
+        self.k8s_namespace = k8s_namespace
+        self.pod_name = pod_name
+        self.timeout = timeout
+        self._proc: Optional[subprocess.Popen] = None
+        # Last lines kubectl wrote to stderr (exec errors: missing pod, RBAC, pod restarts)
+        self._stderr_tail: deque = deque(maxlen=self.STDERR_TAIL_LINES)
+        self._stderr_reader: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PulsarAdminSession":
+        self._proc = subprocess.Popen(
+            ["kubectl", "exec", "-i", "-n", self.k8s_namespace, self.pod_name, "--", "sh"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            check=False
+            bufsize=1,
+            start_new_session=True
         )
-    else:  # partitioned
-        result = subprocess.run(
-            ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-             "bin/pulsar-admin", "topics", "delete-partitioned-topic", topic, "-f"],
-            capture_output=True,
-            text=True,
-            check=False
+        # Drain stderr continuously so a chatty exec can't block on a full pipe
+        self._stderr_reader = threading.Thread(
+            target=self._stderr_tail.extend, args=(self._proc.stderr,), daemon=True
         )
+        self._stderr_reader.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+        self._proc = None
+
+    def _error(self, message: str) -> str:
+        """Append kubectl's recent stderr output (if any) to an error message."""
+        if self._proc is not None and self._proc.poll() is not None and self._stderr_reader:
+            # The exec has exited: let the reader collect its final stderr output
+            self._stderr_reader.join(timeout=1)
+        stderr = "".join(self._stderr_tail).strip()
+        return f"{message}\nkubectl stderr:\n{stderr}" if stderr else message
+
+    def run(self, *args: str, timeout: Optional[int] = None) -> subprocess.CompletedProcess:
+        """
+        Run `bin/pulsar-admin <args>` in the session.
+
+        The command's stdin is /dev/null so it can't consume later commands, and the
+        sentinel is written on a line of its own even if the output lacks a trailing
+        newline. If the command doesn't finish within the timeout the session is
+        killed (later calls return 255) and returncode 124 is returned, as
+        run_command does for timeouts.
+
+        Args:
+            *args: pulsar-admin arguments
+            timeout: Seconds to wait (defaults to the session timeout)
+
+        Returns:
+            CompletedProcess with combined output in stdout (and in stderr on failure)
+        """
+        cmd = ["bin/pulsar-admin", *args]
+        timeout = timeout or self.timeout
+        try:
+            self._proc.stdin.write(
+                f"{shlex.join(cmd)} </dev/null 2>&1; printf '\\n%s %s\\n' {self.SENTINEL} \"$?\"\n"
+            )
+            self._proc.stdin.flush()
+        except (AttributeError, OSError) as e:
+            return subprocess.CompletedProcess(cmd, 255, "", self._error(f"pulsar-admin session unavailable: {e}"))
+
+        # Kill the session if the command hangs; the read loop below then sees EOF
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            try:
+                os.killpg(self._proc.pid, signal.SIGKILL)
+            except OSError:
+                self._proc.kill()
+
+        watchdog = threading.Timer(timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+
+        output = []
+        try:
+            for line in self._proc.stdout:
+                if line.startswith(self.SENTINEL):
+                    returncode = int(line.split()[1])
+                    # Drop the newline printed ahead of the sentinel
+                    text = "".join(output)[:-1]
+                    return subprocess.CompletedProcess(cmd, returncode, text, text if returncode else "")
+                output.append(line)
+        finally:
+            watchdog.cancel()
+
+        if timed_out.is_set():
+            error_msg = self._error(f"pulsar-admin timed out after {timeout}s: {shlex.join(args)}")
+            logger.error(error_msg)
+            return subprocess.CompletedProcess(cmd, 124, "".join(output), error_msg)
+
+        error_msg = self._error("pulsar-admin session closed unexpectedly")
+        logger.error(error_msg)
+        return subprocess.CompletedProcess(cmd, 255, "".join(output), error_msg)
+
+
+def build_bulk_delete_script(partitioned: bool = False, parallelism: int = 10) -> str:
+    """
+    Build the in-pod shell command that deletes topics read from stdin.
 
-    return result.returncode == 0
+    Each topic is deleted with pulsar-admin, up to `parallelism` at a time, and reported
+    on stdout as "OK <topic>" or "FAIL <topic> <reason>", where reason is the last line
+    pulsar-admin printed. Use parse_bulk_delete_line to read the records back.
 
+    Args:
+        partitioned: Use delete-partitioned-topic instead of delete
+        parallelism: Number of concurrent pulsar-admin calls inside the pod
 
-def _delete_single_namespace(ns: str, progress: Progress = None, topic_workers: int = 10) -> NamespaceDeleteResult:
+    Returns:
+        Script suitable for `sh -c`
     """
-    Delete a single Pulsar namespace and all its topics (with parallel topic deletion).
+    subcommand = "delete-partitioned-topic" if partitioned else "delete"
+    return (
+        f"xargs -P {parallelism} -I{{}} sh -c "
+        f"'out=$(bin/pulsar-admin topics {subcommand} \"$1\" -f 2>&1) "
+        f"&& echo \"OK $1\" || echo \"FAIL $1 $(echo \"$out\" | tail -n 1)\"' _ {{}}"
+    )
+
+
+def parse_bulk_delete_line(line: str) -> Optional[Tuple[str, bool, str]]:
+    """
+    Parse one status record written by the build_bulk_delete_script script.
 
     Args:
-        ns: Full namespace path (e.g., public/omb-test-abc)
-        progress: Optional Rich Progress object for sub-task tracking
-        topic_workers: Number of parallel workers for topic deletion (default: 10)
+        line: Output line ("OK <topic>" or "FAIL <topic> <reason>")
 
     Returns:
-        NamespaceDeleteResult with deletion outcome
+        Tuple of (topic, success, reason), or None for lines that aren't status records
     """
-    topics_deleted = 0
-    topics_failed = 0
-    ns_short = ns.split('/')[-1]  # Get just the namespace name for display
-    topic_task = None
+    status, _, rest = line.strip().partition(' ')
+    if status not in ('OK', 'FAIL'):
+        return None
+    topic, _, reason = rest.partition(' ')
+    return topic, status == 'OK', reason.strip()
+
+
+def bulk_delete_topics(
+    topics: List[str],
+    partitioned: bool = False,
+    k8s_namespace: str = "pulsar",
+    parallelism: int = 10,
+    on_result: Optional[Callable[[str, bool, str], None]] = None
+) -> Tuple[int, int]:
+    """
+    Delete topics through a single kubectl exec into the broker pod.
 
-    # First, list all topics (regular + partitioned) to get total count
-    all_topics = []
+    Topic names are streamed over stdin and fanned out with xargs inside the pod,
+    so the kubectl exec setup is paid once instead of once per topic.
 
-    topic_result = subprocess.run(
-        ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-         "bin/pulsar-admin", "topics", "list", ns],
-        capture_output=True,
-        text=True,
-        check=False
-    )
+    Args:
+        topics: Full topic names (persistent://tenant/namespace/topic)
+        partitioned: Use delete-partitioned-topic instead of delete
+        k8s_namespace: Kubernetes namespace of the broker pod
+        parallelism: Number of concurrent pulsar-admin calls inside the pod
+        on_result: Optional callback invoked with (topic, success, reason) as each
+            deletion finishes; reason is pulsar-admin's last output line on failure
+
+    Returns:
+        Tuple of (deleted_count, failed_count)
+    """
+    if not topics:
+        return 0, 0
 
-    if topic_result.returncode == 0:
-        regular_topics = [t.strip() for t in topic_result.stdout.strip().split('\n')
-                        if t.strip() and t.strip().startswith('persistent://')]
-        all_topics.extend([('regular', t) for t in regular_topics])
+    script = build_bulk_delete_script(partitioned, parallelism)
 
-    partitioned_result = subprocess.run(
-        ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-         "bin/pulsar-admin", "topics", "list-partitioned-topics", ns],
-        capture_output=True,
-        text=True,
-        check=False
+    proc = subprocess.Popen(
+        ["kubectl", "exec", "-i", "-n", k8s_namespace, "pulsar-broker-0", "--", "sh", "-c", script],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
     )
 
-    if partitioned_result.returncode == 0:
-        partitioned_topics = [t.strip() for t in partitioned_result.stdout.strip().split('\n')
-                             if t.strip() and t.strip().startswith('persistent://')]
-        all_topics.extend([('partitioned', t) for t in partitioned_topics])
+    # Feed topic names and drain stderr from threads so neither can deadlock against
+    # unread stdout
+    def feed_topics() -> None:
+        try:
+            proc.stdin.write("\n".join(topics) + "\n")
+        except OSError:
+            pass  # exec exited early; reported through its stderr below
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+    stderr_lines: List[str] = []
+    feeder = threading.Thread(target=feed_topics, daemon=True)
+    stderr_reader = threading.Thread(target=lambda: stderr_lines.extend(proc.stderr), daemon=True)
+    feeder.start()
+    stderr_reader.start()
 
-    # Create sub-task for topic deletion if we have topics and a progress bar
-    if progress and all_topics:
-        topic_task = progress.add_task(
-            f"  [dim]{ns_short}[/dim]",
-            total=len(all_topics)
-        )
+    deleted = 0
+    for line in proc.stdout:
+        record = parse_bulk_delete_line(line)
+        if record is None:
+            continue
+        topic, success, reason = record
+        if success:
+            deleted += 1
+        if on_result:
+            on_result(topic, success, reason)
 
-    # Delete all topics in parallel
-    if all_topics:
-        with ThreadPoolExecutor(max_workers=topic_workers) as executor:
-            future_to_topic = {
-                executor.submit(_delete_single_topic, topic_info): topic_info
-                for topic_info in all_topics
-            }
+    feeder.join()
+    stderr_reader.join()
+    if proc.wait() != 0 and not deleted:
+        logger.warning(f"Bulk topic deletion failed: {''.join(stderr_lines).strip()}")
 
-            for future in as_completed(future_to_topic):
-                success = future.result()
-                if success:
-                    topics_deleted += 1
-                else:
-                    topics_failed += 1
+    # Anything not reported as OK (including an exec that never started) counts as failed
+    return deleted, len(topics) - deleted
 
-                if topic_task is not None:
-                    progress.advance(topic_task)
 
-    # Remove sub-task when done
-    if topic_task is not None:
-        progress.remove_task(topic_task)
+def _delete_single_namespace(ns: str, progress: Progress = None, topic_workers: int = 10) -> NamespaceDeleteResult:
+    """
+    Delete a single Pulsar namespace and all its topics (with parallel topic deletion).
 
-    # Now delete the namespace
-    result = subprocess.run(
-        ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-         "bin/pulsar-admin", "namespaces", "delete", ns],
-        capture_output=True,
-        text=True,
-        check=False
-    )
+    Tries `namespaces delete --force` first so the broker removes the namespace and its
+    topics in one call. If the broker rejects it (e.g. forceDeleteNamespaceAllowed=false),
+    falls back to listing and deleting topics before deleting the namespace.
+    All pulsar-admin calls except bulk topic deletion share one PulsarAdminSession.
 
-    if result.returncode == 0:
-        return NamespaceDeleteResult(
-            namespace=ns,
-            success=True,
-            topics_deleted=topics_deleted,
-            topics_failed=topics_failed
-        )
-    else:
-        error_msg = result.stderr.strip()
-        # Filter out "Defaulted container" warnings
-        error_lines = [line for line in error_msg.split('\n')
-                      if 'Defaulted container' not in line]
-        clean_error = '\n'.join(error_lines).strip()
-        return NamespaceDeleteResult(
-            namespace=ns,
-            success=False,
-            topics_deleted=topics_deleted,
-            topics_failed=topics_failed,
-            error=clean_error
-        )
+    Args:
+        ns: Full namespace path (e.g., public/omb-test-abc)
+        progress: Optional Rich Progress object for sub-task tracking
+        topic_workers: Number of parallel topic deletions inside the broker pod (default: 10)
+
+    Returns:
+        NamespaceDeleteResult with deletion outcome
+    """
+    topics_deleted = 0
+    topics_failed = 0
+    ns_short = ns.split('/')[-1]  # Get just the namespace name for display
+    topic_task = None
+
+    with PulsarAdminSession() as admin:
+        # Fast path: broker-side cascading delete, no topic list/delete round trips
+        force_result = admin.run("namespaces", "delete", ns, "--force")
+
+        if force_result.returncode == 0:
+            return NamespaceDeleteResult(
+                namespace=ns,
+                success=True,
+                topics_deleted=0,
+                topics_failed=0,
+                forced=True
+            )
+
+        logger.debug(f"Force delete of {ns} not available, falling back to per-topic cleanup: "
+                     f"{force_result.stderr.strip()}")
+
+        # First, list all topics (regular + partitioned) to get total count
+        all_topics = []
+
+        topic_result = admin.run("topics", "list", ns)
+
+        if topic_result.returncode == 0:
+            regular_topics = [t.strip() for t in topic_result.stdout.strip().split('\n')
+                            if t.strip() and t.strip().startswith('persistent://')]
+            all_topics.extend([('regular', t) for t in regular_topics])
+
+        partitioned_result = admin.run("topics", "list-partitioned-topics", ns)
+
+        if partitioned_result.returncode == 0:
+            partitioned_topics = [t.strip() for t in partitioned_result.stdout.strip().split('\n')
+                                 if t.strip() and t.strip().startswith('persistent://')]
+            all_topics.extend([('partitioned', t) for t in partitioned_topics])
+
+        # Create sub-task for topic deletion if we have topics and a progress bar
+        if progress and all_topics:
+            topic_task = progress.add_task(
+                f"  [dim]{ns_short}[/dim]",
+                total=len(all_topics)
+            )
+
+        # Delete all topics with one exec per topic type (parallelized inside the broker pod)
+        def advance(topic: str, success: bool, reason: str) -> None:
+            if not success:
+                logger.debug(f"Failed to delete topic {topic}: {reason}")
+            if topic_task is not None:
+                progress.advance(topic_task)
+
+        for topic_type in ('regular', 'partitioned'):
+            topics = [topic for t_type, topic in all_topics if t_type == topic_type]
+            deleted, failed = bulk_delete_topics(
+                topics,
+                partitioned=(topic_type == 'partitioned'),
+                parallelism=topic_workers,
+                on_result=advance
+            )
+            topics_deleted += deleted
+            topics_failed += failed
+
+        # Remove sub-task when done
+        if topic_task is not None:
+            progress.remove_task(topic_task)
+
+        # Now delete the namespace
+        result = admin.run("namespaces", "delete", ns)
+
+        if result.returncode == 0:
+            return NamespaceDeleteResult(
+                namespace=ns,
+                success=True,
+                topics_deleted=topics_deleted,
+                topics_failed=topics_failed
+            )
+        else:
+            error_msg = result.stderr.strip()
+            # Filter out "Defaulted container" warnings
+            error_lines = [line for line in error_msg.split('\n')
+                          if 'Defaulted container' not in line]
+            clean_error = '\n'.join(error_lines).strip()
+            return NamespaceDeleteResult(
+                namespace=ns,
+                success=False,
+                topics_deleted=topics_deleted,
+                topics_failed=topics_failed,
+                error=clean_error
+            )
 
 
 def cleanup_pulsar_namespaces(pattern: str = "omb-test-*", dry_run: bool = False, max_workers: int = 5) -> None:
@@ -314,7 +532,12 @@ def cleanup_pulsar_namespaces(pattern: str = "omb-test-*", dry_run: bool = False
                     result = future.result()
                     results.append(result)
 
-                    if result.success:
+                    if result.success and result.forced:
+                        progress.console.print(
+                            f"  [green]✓[/green] {result.namespace} "
+                            f"[dim](force-deleted with all topics)[/dim]"
+                        )
+                    elif result.success:
                         progress.console.print(
                             f"  [green]✓[/green] {result.namespace} "
                             f"[dim](topics: {result.topics_deleted} deleted, {result.topics_failed} failed)[/dim]"
@@ -342,11 +565,14 @@ def cleanup_pulsar_namespaces(pattern: str = "omb-test-*", dry_run: bool = False
     failed = len(errors)
     total_topics_deleted = sum(r.topics_deleted for r in results)
     total_topics_failed = sum(r.topics_failed for r in results)
+    force_deleted = sum(1 for r in results if r.forced)
 
     console.print(f"\n{'='*60}")
     console.print(f"[bold]Summary:[/bold]")
     console.print(f"  Namespaces: [green]{deleted} deleted[/green], [red]{failed} failed[/red]")
     console.print(f"  Topics:     [green]{total_topics_deleted} deleted[/green], [red]{total_topics_failed} failed[/red]")
+    if force_deleted:
+        console.print(f"  [dim]{force_deleted} namespace(s) force-deleted by the broker (topic counts not tracked)[/dim]")
 
     if errors:
         console.print(f"\n[red]Failed namespaces:[/red]")
@@ -4,23 +4,35 @@ Pulsar OMB Load Testing Orchestrator
 Workflow controller for running OpenMessaging Benchmark tests against existing Pulsar clusters
 """
 
+import atexit
+import copy
+import functools
 import json
 import logging
 import os
+import queue
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import boto3
 import yaml
 from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from rich import box
 
+# Use libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 from tui import OrchestratorUI
 from operations import cleanup_pulsar_namespaces, cleanup_pulsar_topics
 from pulsar_manager import PulsarManager
@@ -30,8 +42,9 @@ from metrics_collector import MetricsCollector
 # Import OMB modules
 from omb.workers import WorkerManager
 from omb.manifests import ManifestBuilder
-from omb.metrics import extract_avg_throughput, extract_current_rate_from_logs, format_rate_status
-from omb.plateau import check_plateau
+from omb.metrics import average_publish_rate, format_rate_status, parse_result_json
+from omb.plateau import PlateauTracker
+from omb.watch import JobStatusWatcher, PodLogTailer
 from omb.batch_executor import BatchExecutor
 
 # Setup logging
@@ -62,10 +75,39 @@ class OrchestratorError(Exception):
     pass
 
 
+# Test plan workload_overrides keys applied directly onto OMB workload fields
+WORKLOAD_OVERRIDE_KEYS: Tuple[Tuple[str, str], ...] = (
+    ('topics', 'topics'),
+    ('partitions_per_topic', 'partitionsPerTopic'),
+    ('consumers_per_topic', 'consumerPerSubscription'),
+    ('producers_per_topic', 'producersPerTopic'),
+    ('test_duration_minutes', 'testDurationMinutes'),
+    ('warmup_duration_minutes', 'warmupDurationMinutes'),
+)
+
+# Setup results that don't depend on the experiment, shared by every Orchestrator in this
+# process with the same (namespace, pulsar_service_url). The manager objects themselves are
+# rebuilt per Orchestrator because they hold its experiment directory and UI callbacks.
+_SESSION_CACHE: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict:
+    """Parse a YAML file; cached per (path, mtime) so unchanged files are parsed once."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
 class Orchestrator:
     """Main orchestrator for OMB load testing against existing Pulsar clusters"""
 
-    def __init__(self, experiment_id: Optional[str] = None, namespace: str = "omb", omb_image: Optional[str] = None):
+    def __init__(
+        self,
+        experiment_id: Optional[str] = None,
+        namespace: str = "omb",
+        omb_image: Optional[str] = None,
+        debug_artifacts: bool = False
+    ):
         """
         Initialize orchestrator with experiment tracking.
 
@@ -73,6 +115,7 @@ class Orchestrator:
             experiment_id: Unique experiment identifier (auto-generated if not provided)
             namespace: Kubernetes namespace where OMB jobs will run (default: omb)
             omb_image: OMB Docker image to use (default: from DEFAULT_OMB_IMAGE)
+            debug_artifacts: Also save applied Kubernetes manifests to the experiment directory
         """
         self.experiment_id = experiment_id or f"exp-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
         self.experiment_dir = RESULTS_DIR / self.experiment_id
@@ -81,6 +124,7 @@ class Orchestrator:
         self.pulsar_service_url = PULSAR_SERVICE_URL
         self.pulsar_http_url = PULSAR_HTTP_URL
         self.omb_image = omb_image or DEFAULT_OMB_IMAGE
+        self.debug_artifacts = debug_artifacts
         self.pulsar_tenant_namespace = PULSAR_TEST_NAMESPACE  # Will be updated with actual namespace after detection
 
         # Initialize TUI
@@ -94,12 +138,32 @@ class Orchestrator:
         # Store test results from immediate collection
         self.test_results = ""
 
+        # Shared pool for overlapping I/O-bound setup/teardown calls with other work
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="orchestrator")
+
+        # Number of workers already ensured and Ready for the current test plan (0 = none)
+        self._warm_worker_count = 0
+
+        # Result file listing, filled once after tests finish (see _get_result_files)
+        self._result_files: Optional[List[Path]] = None
+
+        # (base workload, template) cache for _generate_workload
+        self._workload_template: Optional[Tuple[Dict, Dict]] = None
+
+        session = _SESSION_CACHE.setdefault((self.namespace, self.pulsar_service_url), {})
+
+        # In-process API clients for hot-path status polls (reuse one connection instead
+        # of starting kubectl per call); None means fall back to kubectl
+        if 'k8s_clients' not in session:
+            session['k8s_clients'] = self._create_k8s_clients()
+        self._core_v1, self._batch_v1 = session['k8s_clients']
+
         # Initialize managers
         self.pulsar_manager = PulsarManager(
             pulsar_namespace=self.pulsar_tenant_namespace,
             run_command_func=self.run_command,
             add_status_func=self._add_status,
-            create_layout_func=self._create_layout
+            refresh_live_func=self._refresh_live
         )
 
         self.results_collector = ResultsCollector(
@@ -131,8 +195,11 @@ class Orchestrator:
         self.metrics_collector = MetricsCollector(
             namespace="pulsar",  # Pulsar components are in "pulsar" namespace
             experiment_dir=self.experiment_dir,
-            run_command_func=self.run_command
+            run_command_func=self.run_command,
+            prometheus_url=session.get('prometheus_url')
         )
+        if self.metrics_collector.prometheus_url:
+            session['prometheus_url'] = self.metrics_collector.prometheus_url
 
         # Initialize batch executor for batch mode tests
         self.batch_executor = BatchExecutor(
@@ -143,32 +210,49 @@ class Orchestrator:
             manifest_builder=self.manifest_builder,
             run_command_func=self.run_command,
             add_status_func=self._add_status,
-            create_layout_func=self._create_layout
+            refresh_live_func=self._refresh_live,
+            debug_artifacts=self.debug_artifacts
         )
 
-        # Ensure K8s namespace exists
-        self._ensure_namespace_exists()
-
-        # Ensure Pulsar namespace exists
-        self.pulsar_manager.ensure_pulsar_namespace_exists()
+        # Ensure K8s and Pulsar namespaces exist (once per session)
+        if not session.get('namespaces_ensured'):
+            self._ensure_namespace_exists()
+            self.pulsar_manager.ensure_pulsar_namespace_exists()
+            session['namespaces_ensured'] = True
 
-        # Create/update "latest" symlink
-        latest_link = RESULTS_DIR / "latest"
-        if latest_link.exists() or latest_link.is_symlink():
-            latest_link.unlink()
-        latest_link.symlink_to(self.experiment_dir)
+        # Create/update "latest" symlink atomically: link under a temp name, then rename over
+        tmp_link = RESULTS_DIR / f".latest.{os.getpid()}"
+        os.symlink(self.experiment_dir, tmp_link)
+        os.replace(tmp_link, RESULTS_DIR / "latest")
 
-        # Setup logging to file
+        # Setup logging to file; records are queued and written by a background listener
+        # so file I/O stays off the polling hot path
         log_file = self.experiment_dir / "orchestrator.log"
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         ))
-        logger.addHandler(file_handler)
+        log_queue = queue.SimpleQueue()
+        self._log_listener = QueueListener(log_queue, file_handler)
+        self._log_listener.start()
+        self._log_handler = QueueHandler(log_queue)
+        logger.addHandler(self._log_handler)
+        atexit.register(self.close)
 
         logger.info(f"Initialized orchestrator for experiment: {self.experiment_id}")
         self._display_initial_info()
 
+    def close(self) -> None:
+        """Flush queued log records to the log file and release background resources."""
+        if self._log_listener is None:
+            return
+        logger.removeHandler(self._log_handler)
+        self._log_listener.stop()
+        for handler in self._log_listener.handlers:
+            handler.close()
+        self._log_listener = None
+        self._executor.shutdown(wait=False)
+
     @property
     def console(self):
         """Delegate console access to UI."""
@@ -200,6 +284,28 @@ class Orchestrator:
         self.console.print(Panel(table, title="[bold cyan]Experiment Configuration[/bold cyan]", border_style="cyan"))
         self.console.print()
 
+    @staticmethod
+    def _create_k8s_clients() -> Tuple[Optional[Any], Optional[Any]]:
+        """
+        Create Kubernetes API clients from the local kubeconfig.
+
+        The kubernetes package is imported here rather than at module load, so commands
+        that never build an Orchestrator (list, cleanup-workers) don't pay for it.
+
+        Returns:
+            (CoreV1Api, BatchV1Api), or (None, None) if the client is unavailable
+        """
+        try:
+            from kubernetes import client as k8s_client, config as k8s_config
+        except ImportError:
+            return (None, None)
+        try:
+            k8s_config.load_kube_config()
+            return (k8s_client.CoreV1Api(), k8s_client.BatchV1Api())
+        except Exception as e:
+            logger.debug(f"Kubernetes client not configured, using kubectl for status polls: {e}")
+            return (None, None)
+
     def _ensure_namespace_exists(self) -> None:
         """Ensure the K8s namespace exists, create if not."""
         result = self.run_command(
@@ -219,6 +325,20 @@ class Orchestrator:
         else:
             logger.debug(f"K8s namespace '{self.namespace}' already exists")
 
+    def _apply_manifest(self, manifest: str, description: str, artifact_name: str) -> None:
+        """
+        Apply a manifest by piping it to `kubectl apply -f -`.
+
+        Args:
+            manifest: YAML manifest content
+            description: Human-readable description
+            artifact_name: File name used when saving the manifest with debug_artifacts
+        """
+        if self.debug_artifacts:
+            (self.experiment_dir / artifact_name).write_text(manifest)
+
+        self.run_command(["kubectl", "apply", "-f", "-"], description, input=manifest)
+
     def _add_status(self, message: str, level: str = 'info') -> None:
         """Add a status message (delegates to UI)."""
         self.ui.add_status(message, level)
@@ -227,6 +347,32 @@ class Orchestrator:
         """Create the UI layout (delegates to UI)."""
         return self.ui.create_layout()
 
+    def _set_pulsar_namespace(self, namespace: str) -> None:
+        """
+        Record the Pulsar namespace OMB is actually using for this run.
+
+        PulsarManager's cleanup (including the per-run namespace force delete at
+        teardown) works on pulsar_tenant_namespace, so it is updated alongside the TUI.
+        """
+        self.pulsar_tenant_namespace = namespace
+        self.pulsar_manager.pulsar_tenant_namespace = namespace
+        self.ui.set_pulsar_namespace(namespace)  # Update TUI display
+
+    def _refresh_live(self, live: Live) -> None:
+        """
+        Redraw the Live display.
+
+        Live runs with auto_refresh disabled, so the screen is only redrawn here, at
+        status changes, instead of on a background timer. Calls where no panel data
+        changed since the last redraw are skipped.
+
+        Args:
+            live: Active Live display
+        """
+        if not self.ui.is_dirty:
+            return
+        live.update(self._create_layout(), refresh=True)
+
 
     def load_config(self, config_file: Path) -> Dict:
         """
@@ -239,8 +385,9 @@ class Orchestrator:
             Parsed configuration dictionary
         """
         logger.info(f"Loading configuration from {config_file}")
-        with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+        parsed = _load_yaml_cached(str(config_file), Path(config_file).stat().st_mtime_ns)
+        # Hand out a copy so callers can't mutate the cached parse
+        return copy.deepcopy(parsed)
 
     def run_command(
         self,
@@ -248,7 +395,9 @@ class Orchestrator:
         description: str,
         capture_output: bool = False,
         check: bool = True,
-        timeout: Optional[int] = None
+        timeout: Optional[int] = None,
+        input: Optional[str] = None,
+        discard_stdout: bool = False
     ) -> subprocess.CompletedProcess:
         """
         Run shell command with logging.
@@ -259,6 +408,9 @@ class Orchestrator:
             capture_output: Whether to capture stdout/stderr
             check: Whether to raise exception on non-zero exit
             timeout: Optional timeout in seconds
+            input: Optional text to write to the command's stdin (e.g. for `kubectl apply -f -`)
+            discard_stdout: Send stdout to /dev/null and capture only stderr, for commands
+                whose output is never read (overrides capture_output)
 
         Returns:
             CompletedProcess object
@@ -269,13 +421,19 @@ class Orchestrator:
         logger.info(f"Running: {description}")
         logger.debug(f"Command: {' '.join(cmd)}")
 
+        if discard_stdout:
+            streams = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE}
+        else:
+            streams = {'capture_output': capture_output}
+
         try:
             result = subprocess.run(
                 cmd,
-                capture_output=capture_output,
+                **streams,
                 text=True,
                 check=check,
-                timeout=timeout
+                timeout=timeout,
+                input=input
             )
             if capture_output and result.stdout:
                 logger.debug(f"Output: {result.stdout[:500]}")
@@ -289,12 +447,114 @@ class Orchestrator:
             return subprocess.CompletedProcess(cmd, returncode=124, stdout="", stderr=str(e))
         except subprocess.CalledProcessError as e:
             error_msg = f"Command failed: {description}"
-            if capture_output and e.stderr:
+            if e.stderr:
                 error_msg += f"\nError: {e.stderr}"
             logger.error(error_msg)
             raise OrchestratorError(error_msg) from e
 
+    def _get_job_status(self, job_name: str) -> Optional[Tuple[int, int, int]]:
+        """
+        Get (succeeded, failed, active) counts for a Job.
+
+        Returns:
+            Counts tuple, or None if the Job could not be read
+        """
+        if self._batch_v1:
+            try:
+                status = self._batch_v1.read_namespaced_job_status(job_name, self.namespace).status
+                return (status.succeeded or 0, status.failed or 0, status.active or 0)
+            except Exception as e:
+                logger.debug(f"Kubernetes API read of Job {job_name} failed, using kubectl: {e}")
+
+        # Let the apiserver project the three counts instead of returning the full Job
+        result = self.run_command(
+            ["kubectl", "get", "job", job_name, "-n", self.namespace,
+             "-o", "jsonpath={.status.succeeded}|{.status.failed}|{.status.active}"],
+            f"Get Job {job_name} status",
+            capture_output=True,
+            check=False
+        )
+        if result.returncode != 0:
+            return None
+        succeeded, failed, active = (int(x or 0) for x in result.stdout.strip().split("|"))
+        return (succeeded, failed, active)
 
+    def _get_job_pod(self, job_name: str) -> Optional[Tuple[str, str]]:
+        """
+        Get the name and phase of a Job's pod.
+
+        Returns:
+            (pod_name, phase) tuple, or None if no pod exists yet
+        """
+        selector = f"job-name={job_name}"
+        if self._core_v1:
+            try:
+                pods = self._core_v1.list_namespaced_pod(self.namespace, label_selector=selector).items
+                return (pods[0].metadata.name, pods[0].status.phase) if pods else None
+            except Exception as e:
+                logger.debug(f"Kubernetes API pod list for {job_name} failed, using kubectl: {e}")
+
+        result = self.run_command(
+            ["kubectl", "get", "pods", "-n", self.namespace,
+             "-l", selector,
+             "-o", "jsonpath={.items[0].metadata.name}|{.items[0].status.phase}"],
+            f"Get pod for {job_name}",
+            capture_output=True,
+            check=False
+        )
+        pod_name, _, phase = result.stdout.strip().partition("|") if result.returncode == 0 else ("", "", "")
+        return (pod_name, phase) if pod_name else None
+
+    def _wait_for_pod_terminal(self, job_name: str, timeout: float = 2.0) -> None:
+        """
+        Wait until a Job's pod reaches a terminal phase, for at most timeout seconds.
+
+        Returns immediately if the pod is already Failed/Succeeded or no longer exists.
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            pod = self._get_job_pod(job_name)
+            if pod is None or pod[1] in ("Failed", "Succeeded"):
+                return
+            time.sleep(0.25)
+
+    def _prepare_workers(self, num_workers: int, live: Live) -> None:
+        """
+        Ensure num_workers persistent worker pods exist and wait until they are Ready.
+
+        Args:
+            num_workers: Number of workers required
+            live: Rich Live display instance
+
+        Raises:
+            OrchestratorError: If workers cannot be ensured
+        """
+        # Ensure we have enough workers (persistent across all tests)
+        self._add_status(f"Ensuring {num_workers} worker pods are available", 'info')
+        self._refresh_live(live)
+        try:
+            self.worker_manager.ensure_workers(num_workers)
+            self._add_status(f"✓ Workers ready (persistent pool)", 'success')
+            self._refresh_live(live)
+
+            # Wait for workers to start the JVM and bind the HTTP server (readiness probe),
+            # returning immediately when persistent workers are already Ready
+            self._add_status(f"Waiting up to 30s for workers to become ready...", 'info')
+            self._refresh_live(live)
+
+            def show_progress(elapsed: float) -> None:
+                progress = min(elapsed, 30) / 30 * 100
+                self._add_status(f"Waiting for worker startup: {elapsed:.0f}/30s ({progress:.0f}%)", 'info')
+                self._refresh_live(live)
+
+            if self.worker_manager.wait_until_ready(num_workers, timeout=30, on_tick=show_progress):
+                self._add_status(f"✓ Workers ready", 'success')
+                self._warm_worker_count = max(self._warm_worker_count, num_workers)
+            else:
+                self._add_status(f"⚠ Workers not all ready after 30s, continuing", 'warning')
+            self._refresh_live(live)
+        except Exception as e:
+            raise OrchestratorError(f"Failed to ensure workers: {e}")
 
     def run_omb_job(self, test_config: Dict, workload_config: Dict, live: Live) -> str:
         """
@@ -324,87 +584,70 @@ class Orchestrator:
         }
 
         self._add_status(f"Starting test: {test_name}", 'info')
-        live.update(self._create_layout())
-
-        # Ensure we have enough workers (persistent across all tests)
-        self._add_status(f"Ensuring {num_workers} worker pods are available", 'info')
-        live.update(self._create_layout())
-        try:
-            self.worker_manager.ensure_workers(num_workers)
-            self._add_status(f"✓ Workers ready (persistent pool)", 'success')
-            live.update(self._create_layout())
+        self._refresh_live(live)
 
-            # Give workers time to fully start up JVM and bind HTTP server
-            self._add_status(f"Waiting 30s for workers to fully initialize...", 'info')
-            live.update(self._create_layout())
-
-            # Progress countdown for 30 second wait
-            for i in range(30):
-                progress = (i + 1) / 30 * 100
-                self._add_status(f"Waiting for worker startup: {i+1}/30s ({progress:.0f}%)", 'info')
-                live.update(self._create_layout())
-                time.sleep(1)
+        # Collect baseline infrastructure metrics in the background while workers warm up
+        self._add_status("Collecting baseline infrastructure metrics...", 'info')
+        self._refresh_live(live)
+        baseline_future = self._executor.submit(self.metrics_collector.collect_baseline_metrics)
 
-            self._add_status(f"✓ Worker startup grace period complete", 'success')
-            live.update(self._create_layout())
-        except Exception as e:
-            raise OrchestratorError(f"Failed to ensure workers: {e}")
+        # Warmed workers skip ensure_workers, but are still checked: one may have been
+        # restarted or OOM-killed since the last stage
+        if num_workers <= self._warm_worker_count and self.worker_manager.wait_until_ready(num_workers):
+            logger.info(f"Workers already warmed for this test plan ({self._warm_worker_count} >= {num_workers}) and Ready")
+        else:
+            self._warm_worker_count = 0
+            self._prepare_workers(num_workers, live)
 
         # Generate workload ConfigMap
         workload_yaml = self.manifest_builder.build_workload_configmap(test_name, workload_config)
-        workload_file = self.experiment_dir / f"workload_{test_name}.yaml"
-
-        with open(workload_file, 'w') as f:
-            f.write(workload_yaml)
 
         # Apply workload ConfigMap
         self._add_status("Creating workload ConfigMap", 'info')
-        live.update(self._create_layout())
-        self.run_command(
-            ["kubectl", "apply", "-f", str(workload_file)],
-            f"Apply workload ConfigMap for {test_name}"
+        self._refresh_live(live)
+        self._apply_manifest(
+            workload_yaml,
+            f"Apply workload ConfigMap for {test_name}",
+            f"workload_{test_name}.yaml"
         )
 
         # Create OMB driver Job
         job_yaml = self.manifest_builder.build_driver_job(test_name, num_workers)
-        job_file = self.experiment_dir / f"omb_job_{test_name}.yaml"
-
-        with open(job_file, 'w') as f:
-            f.write(job_yaml)
 
-        # Collect baseline infrastructure metrics before test
-        self._add_status("Collecting baseline infrastructure metrics...", 'info')
-        live.update(self._create_layout())
+        # Baseline must describe the cluster before load starts, so join it before the Job
         try:
-            self.metrics_collector.collect_baseline_metrics()
+            baseline_future.result()
             self._add_status("✓ Baseline metrics collected", 'success')
         except Exception as e:
             logger.warning(f"Failed to collect baseline metrics: {e}")
             self._add_status("⚠ Failed to collect baseline metrics", 'warning')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         # Apply Job
         self._add_status("Starting driver Job", 'info')
-        live.update(self._create_layout())
-        self.run_command(
-            ["kubectl", "apply", "-f", str(job_file)],
-            f"Create OMB driver Job for {test_name}"
+        self._refresh_live(live)
+        self._apply_manifest(
+            job_yaml,
+            f"Create OMB driver Job for {test_name}",
+            f"omb_job_{test_name}.yaml"
         )
+        job_started_at = time.time()
+        job_name = f"omb-{test_name}"
 
         # Start background metrics collection
         self._add_status("Starting background metrics collection...", 'info')
-        live.update(self._create_layout())
+        self._refresh_live(live)
         try:
             self.metrics_collector.start_background_collection(interval_seconds=30)
             self._add_status("✓ Background metrics collection started", 'success')
         except Exception as e:
             logger.warning(f"Failed to start background metrics collection: {e}")
             self._add_status("⚠ Background metrics collection disabled", 'warning')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         # Wait for Job pod to start and read logs to detect namespace
         self._add_status("Waiting for Job pod to start...", 'info')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         # Wait for Job pod to be running and producing logs
         max_wait = 60  # 60 seconds
@@ -412,74 +655,69 @@ class Orchestrator:
         pod_running = False
 
         while time.time() - wait_start < max_wait:
-            result = self.run_command(
-                ["kubectl", "get", "pods", "-n", "omb",
-                 "-l", f"job-name=omb-{test_name}",
-                 "-o", "jsonpath={.items[0].status.phase}"],
-                "Check Job pod status",
-                capture_output=True,
-                check=False
-            )
-
-            if result.returncode == 0 and result.stdout.strip() == "Running":
+            pod = self._get_job_pod(job_name)
+            if pod and pod[1] == "Running":
                 pod_running = True
                 break
 
             time.sleep(2)
 
+        # Only consider worker log lines written since this Job started (workers are persistent)
+        def detect_from_logs(warn_if_missing: bool) -> Optional[str]:
+            return self.pulsar_manager.detect_pulsar_namespace_from_logs(
+                test_name,
+                self.namespace,
+                since_seconds=int(time.time() - job_started_at) + 5,
+                warn_if_missing=warn_if_missing
+            )
+
+        detected_ns = None
         if not pod_running:
             logger.warning("Job pod did not reach Running state within timeout")
             self._add_status("⚠ Job pod not running yet, may not detect namespace", 'warning')
-            live.update(self._create_layout())
+            self._refresh_live(live)
         else:
-            # Wait additional time for OMB workers to initialize and create namespace
+            # OMB workers need time to initialize PulsarBenchmarkDriver and create namespace.
+            # The driver logs "Created Pulsar namespace" during initialization on worker pods,
+            # so poll for it and continue as soon as it appears instead of sleeping a fixed 30s.
             self._add_status("Job running, waiting for worker initialization and namespace creation...", 'info')
-            live.update(self._create_layout())
-            # OMB workers need time to initialize PulsarBenchmarkDriver and create namespace
-            # The driver logs "Created Pulsar namespace" during initialization on worker pods
-            time.sleep(30)  # Increased from 15s to allow workers to fully initialize
+            self._refresh_live(live)
+            init_deadline = time.time() + 30
+            while time.time() < init_deadline:
+                time.sleep(min(5, max(0.0, init_deadline - time.time())))
+                detected_ns = detect_from_logs(warn_if_missing=False)
+                if detected_ns:
+                    break
 
         # Try to get namespace from worker pod logs (OMB logs namespace during driver initialization)
         self._add_status("Detecting Pulsar namespace from worker pod logs...", 'info')
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
-        detected_ns = self.pulsar_manager.detect_pulsar_namespace_from_logs(test_name, self.namespace)
+        if not detected_ns:
+            detected_ns = detect_from_logs(warn_if_missing=True)
         if detected_ns:
-            self.pulsar_tenant_namespace = detected_ns
-            self.pulsar_manager.pulsar_namespace = detected_ns
-            self.ui.set_pulsar_namespace(detected_ns)  # Update TUI display
+            self._set_pulsar_namespace(detected_ns)
             self._add_status(f"✓ Pulsar namespace: {detected_ns}", 'success')
             logger.info(f"Using Pulsar namespace: {detected_ns}")
         else:
             # Fallback to topic-based detection with retry (wait for topics to be created)
             logger.warning("Could not detect namespace from logs, falling back to topic search")
             self._add_status("Waiting for topics to be created for namespace detection...", 'info')
-            live.update(self._create_layout())
-
-            # Retry topic detection for up to 60 seconds (topics should appear within warmup)
-            max_retries = 12  # 12 * 5s = 60s
-            for attempt in range(max_retries):
-                detected_ns = self.pulsar_manager.detect_pulsar_namespace()
-                if detected_ns:
-                    self.pulsar_tenant_namespace = detected_ns
-                    self.pulsar_manager.pulsar_namespace = detected_ns
-                    self.ui.set_pulsar_namespace(detected_ns)  # Update TUI display
-                    self._add_status(f"✓ Pulsar namespace: {detected_ns} (detected from topics)", 'success')
-                    logger.info(f"Detected namespace with topics after {attempt + 1} attempts: {detected_ns}")
-                    break
-
-                if attempt < max_retries - 1:
-                    logger.debug(f"No namespace with topics yet, retrying in 5s (attempt {attempt + 1}/{max_retries})")
-                    time.sleep(5)
+            self._refresh_live(live)
+
+            # Wait up to 60 seconds for topics to appear (they should within warmup)
+            detected_ns = self.pulsar_manager.wait_for_namespace_with_topics(timeout=60)
+            if detected_ns:
+                self._set_pulsar_namespace(detected_ns)
+                self._add_status(f"✓ Pulsar namespace: {detected_ns} (detected from topics)", 'success')
+                logger.info(f"Detected namespace with topics: {detected_ns}")
             else:
-                # After all retries, still couldn't detect
                 self._add_status("⚠ Could not detect Pulsar namespace with topics", 'warning')
-                logger.warning(f"Failed to detect namespace with topics after {max_retries} attempts")
-        live.update(self._create_layout())
+        self._refresh_live(live)
 
         # Wait for Job completion or failure
         self._add_status(f"Running benchmark test (this may take several minutes)...", 'info')
-        live.update(self._create_layout())
+        self._refresh_live(live)
         # Calculate expected test duration from workload config
         warmup_minutes = workload_config.get('warmupDurationMinutes', 1)
         test_minutes = workload_config.get('testDurationMinutes', 5)
@@ -494,127 +732,135 @@ class Orchestrator:
         # Poll Job status until complete or failed
         timeout_seconds = expected_duration_seconds + (10 * 60)  # Expected duration + 10min buffer
         start_time = time.time()
-        poll_interval = 10  # Check Job status every 10 seconds
+        min_poll_interval = 2  # Poll quickly at start and after each Job state change
+        max_poll_interval = 60  # Back off to at most once a minute while the Job is steady
         log_poll_interval = 5  # Check logs more frequently when near completion
+        poll_interval = min_poll_interval
+        last_active_count = None
 
         job_succeeded = False
         job_failed = False
         results_collected = False
 
-        while time.time() - start_time < timeout_seconds:
-            result = self.run_command(
-                ["kubectl", "get", "job", f"omb-{test_name}", "-n", self.namespace, "-o", "json"],
-                f"Get Job {test_name} status",
-                capture_output=True,
-                check=False
-            )
-
-            if result.returncode == 0:
-                job_status = json.loads(result.stdout)
-                status = job_status.get('status', {})
-
-                # Check for completion via succeeded/failed counts (more reliable than conditions)
-                succeeded_count = status.get('succeeded', 0)
-                failed_count = status.get('failed', 0)
-                active_count = status.get('active', 0)
-
-                if succeeded_count > 0:
-                    job_succeeded = True
-                    self._add_status(f"✓ Benchmark completed successfully", 'success')
-                    live.update(self._create_layout())
-                    logger.info(f"✓ Job {test_name} completed successfully (succeeded: {succeeded_count})")
-
-                    # Results already collected during sleep window
-                    if results_collected:
-                        logger.info(f"Results already collected during sleep window")
-                    else:
-                        # Fallback: collect now if we somehow missed the sleep window
-                        self._add_status("Collecting test results...", 'info')
-                        live.update(self._create_layout())
-                        logger.info(f"Collecting results for {test_name}...")
-                        results = self.results_collector.collect_job_logs(test_name, success=True)
-
-                        if results:
-                            self._add_status(f"✓ Results collected ({len(results)} bytes)", 'success')
-                            self.test_results = results
+        # The Job's pod name is looked up once and reused
+        pod_name: Optional[str] = None
+        log_tailer: Optional[PodLogTailer] = None
+
+        # Stream Job status and driver logs instead of issuing kubectl calls per tick
+        with ExitStack() as watches:
+            job_watcher = watches.enter_context(JobStatusWatcher(job_name, self.namespace))
+            while time.time() - start_time < timeout_seconds:
+                # Read Job status from the watch cache; fall back to a direct read until it has data
+                counts = job_watcher.counts() or self._get_job_status(job_name)
+
+                if counts is not None:
+                    # Check for completion via succeeded/failed counts (more reliable than conditions)
+                    succeeded_count, failed_count, active_count = counts
+
+                    if succeeded_count > 0:
+                        job_succeeded = True
+                        self._add_status(f"✓ Benchmark completed successfully", 'success')
+                        self._refresh_live(live)
+                        logger.info(f"✓ Job {test_name} completed successfully (succeeded: {succeeded_count})")
+
+                        # Results already collected during sleep window
+                        if results_collected:
+                            logger.info(f"Results already collected during sleep window")
                         else:
-                            self._add_status("⚠ No results data collected", 'warning')
-                            self.test_results = ""
-                        live.update(self._create_layout())
-
-                    break
-                elif failed_count > 0:
-                    job_failed = True
-                    self._add_status(f"✗ Benchmark failed", 'error')
-                    live.update(self._create_layout())
-                    logger.error(f"✗ Job {test_name} failed (failed: {failed_count})")
-                    # Give pod a moment to fully terminate before collecting logs
-                    time.sleep(2)
-                    break
-
-                # Still running - check if we should start polling for sleep message
+                            # Fallback: collect now if we somehow missed the sleep window
+                            self._add_status("Collecting test results...", 'info')
+                            self._refresh_live(live)
+                            logger.info(f"Collecting results for {test_name}...")
+                            results = self.results_collector.collect_job_logs(test_name, success=True)
+
+                            if results:
+                                self._add_status(f"✓ Results collected ({len(results)} bytes)", 'success')
+                                self.test_results = results
+                            else:
+                                self._add_status("⚠ No results data collected", 'warning')
+                                self.test_results = ""
+                            self._refresh_live(live)
+
+                        break
+                    elif failed_count > 0:
+                        job_failed = True
+                        self._add_status(f"✗ Benchmark failed", 'error')
+                        self._refresh_live(live)
+                        logger.error(f"✗ Job {test_name} failed (failed: {failed_count})")
+                        # Give pod a moment to fully terminate before collecting logs
+                        self._wait_for_pod_terminal(job_name, timeout=2.0)
+                        break
+
+                    # Still running - check if we should start polling for sleep message
+                    elapsed = int(time.time() - start_time)
+                    current_rate = None  # Will be populated from logs if available
+
+                    # Poll logs for current rate and (near completion) sleep message
+                    if active_count > 0:
+                        # Check pod logs for the sleep message
+                        if pod_name is None:
+                            pod = self._get_job_pod(job_name)
+                            if pod:
+                                pod_name = pod[0]
+
+                        # Follow the driver logs once; restart only if the pod was replaced
+                        if pod_name and (log_tailer is None or log_tailer.pod_name != pod_name):
+                            if log_tailer:
+                                log_tailer.stop()
+                            log_tailer = watches.enter_context(PodLogTailer(pod_name, self.namespace))
+
+                        if log_tailer:
+                            # Current publish rate from the log stream for status display
+                            current_rate = log_tailer.latest_rate
+                            if log_tailer.failed:
+                                # Pod may have been replaced; look the name up again next tick
+                                pod_name = None
+
+                            # Only collect results when near expected completion
+                            if elapsed >= check_sleep_after and not results_collected:
+                                if log_tailer.sleep_detected.is_set():
+                                    # Sleep message detected! Pod is in the collection window
+                                    logger.info(f"✓ Detected sleep message in logs - collecting results during 60s window")
+                                    self._add_status("Collecting test results (during sleep window)...", 'info')
+                                    self._refresh_live(live)
+
+                                    results = self.results_collector.collect_job_logs(test_name, success=True)
+
+                                    if results:
+                                        self._add_status(f"✓ Results collected ({len(results)} bytes)", 'success')
+                                        self.test_results = results
+                                        results_collected = True
+                                        logger.info(f"✓ Results collected successfully during sleep window")
+                                    else:
+                                        logger.warning(f"Failed to collect results during sleep window")
+
+                                    self._refresh_live(live)
+
+                    # Log progress with rate info if available
+                    minutes = elapsed // 60
+                    seconds = elapsed % 60
+                    status = format_rate_status(f"[{minutes}m {seconds}s]", target_rate, current_rate)
+                    self._add_status(status, 'info')
+                    self._refresh_live(live)
+                    logger.info(f"Job {test_name} still running... ({elapsed}s elapsed, active: {active_count}, succeeded: {succeeded_count}, failed: {failed_count})")
+
+                    # Reset the backoff whenever the Job's active count changes
+                    if active_count != last_active_count:
+                        poll_interval = min_poll_interval
+                        last_active_count = active_count
+
+                # Use shorter poll interval when checking for sleep message; otherwise back off
+                # exponentially, without sleeping past the point where that check starts
                 elapsed = int(time.time() - start_time)
-                current_rate = None  # Will be populated from logs if available
-
-                # Poll logs for current rate and (near completion) sleep message
-                if active_count > 0:
-                    # Check pod logs for the sleep message
-                    pod_name_result = self.run_command(
-                        ["kubectl", "get", "pods", "-n", self.namespace,
-                         "-l", f"job-name=omb-{test_name}",
-                         "-o", "jsonpath={.items[0].metadata.name}"],
-                        f"Get pod name for {test_name}",
-                        capture_output=True,
-                        check=False
-                    )
+                if elapsed >= check_sleep_after and not results_collected:
+                    wait_seconds = log_poll_interval
+                else:
+                    wait_seconds = min(poll_interval, max(min_poll_interval, check_sleep_after - elapsed))
+                    poll_interval = min(poll_interval * 1.5, max_poll_interval)
 
-                    if pod_name_result.returncode == 0 and pod_name_result.stdout.strip():
-                        pod_name = pod_name_result.stdout.strip()
-                        # Get last 50 lines of logs to check for sleep message and current rate
-                        log_result = self.run_command(
-                            ["kubectl", "logs", pod_name, "-n", self.namespace, "--tail=50"],
-                            f"Check logs for status",
-                            capture_output=True,
-                            check=False
-                        )
-
-                        # Extract current publish rate from logs for status display
-                        if log_result.returncode == 0:
-                            current_rate = extract_current_rate_from_logs(log_result.stdout)
-
-                        # Only collect results when near expected completion
-                        if elapsed >= check_sleep_after and not results_collected:
-                            if log_result.returncode == 0 and "seconds to allow results collection" in log_result.stdout:
-                                # Sleep message detected! Pod is in the collection window
-                                logger.info(f"✓ Detected sleep message in logs - collecting results during 60s window")
-                                self._add_status("Collecting test results (during sleep window)...", 'info')
-                                live.update(self._create_layout())
-
-                                results = self.results_collector.collect_job_logs(test_name, success=True)
-
-                                if results:
-                                    self._add_status(f"✓ Results collected ({len(results)} bytes)", 'success')
-                                    self.test_results = results
-                                    results_collected = True
-                                    logger.info(f"✓ Results collected successfully during sleep window")
-                                else:
-                                    logger.warning(f"Failed to collect results during sleep window")
-
-                                live.update(self._create_layout())
-
-                # Log progress with rate info if available
-                minutes = elapsed // 60
-                seconds = elapsed % 60
-                status = format_rate_status(f"[{minutes}m {seconds}s]", target_rate, current_rate)
-                self._add_status(status, 'info')
-                live.update(self._create_layout())
-                logger.info(f"Job {test_name} still running... ({elapsed}s elapsed, active: {active_count}, succeeded: {succeeded_count}, failed: {failed_count})")
-
-            # Use shorter poll interval when checking for sleep message
-            if elapsed >= check_sleep_after and not results_collected:
-                time.sleep(log_poll_interval)
-            else:
-                time.sleep(poll_interval)
+                # Wake early if the watch sees the Job status change
+                job_watcher.changed.wait(wait_seconds)
+                job_watcher.changed.clear()
 
         if not (job_succeeded or job_failed):
             logger.error(f"Timeout waiting for Job {test_name} after {timeout_seconds}s")
@@ -631,7 +877,7 @@ class Orchestrator:
 
         # Stop background metrics collection and save timeseries
         self._add_status("Stopping metrics collection...", 'info')
-        live.update(self._create_layout())
+        self._refresh_live(live)
         try:
             self.metrics_collector.stop_background_collection()
             self.metrics_collector.collect_final_metrics()
@@ -640,28 +886,31 @@ class Orchestrator:
         except Exception as e:
             logger.warning(f"Failed to finalize metrics collection: {e}")
             self._add_status("⚠ Metrics collection incomplete", 'warning')
-        live.update(self._create_layout())
-
-        # Cleanup Pulsar topics created during test
-        self.pulsar_manager.cleanup_test_topics(live)
+        self._refresh_live(live)
 
-        # Cleanup ephemeral test resources (workers are persistent and reused)
+        # Cleanup Pulsar topics created during test (dropping the per-run namespace when the
+        # broker allows it) and, concurrently, the ephemeral test resources (workers are
+        # persistent and reused) in one request; --wait=false returns once the apiserver
+        # accepts the deletion
         logger.info(f"Cleaning up test resources for {test_name}...")
-        self.run_command(
-            ["kubectl", "delete", "job", f"omb-{test_name}", "-n", self.namespace],
-            f"Delete OMB driver Job {test_name}",
-            check=False
-        )
-        self.run_command(
-            ["kubectl", "delete", "configmap", f"omb-workload-{test_name}", "-n", self.namespace],
-            f"Delete workload ConfigMap {test_name}",
-            check=False
-        )
+        teardown = [
+            self._executor.submit(self.pulsar_manager.cleanup_test_topics, live, drop_namespace=True),
+            self._executor.submit(
+                self.run_command,
+                ["kubectl", "delete", f"job/omb-{test_name}", f"configmap/omb-workload-{test_name}",
+                 "-n", self.namespace, "--wait=false"],
+                f"Delete OMB driver Job and workload ConfigMap {test_name}",
+                check=False,
+                discard_stdout=True
+            ),
+        ]
+        for future in teardown:
+            future.result()
         # Note: Workers are persistent and reused across tests - not deleted here
 
         return results
 
-    def run_tests(self, test_plan_file: Path) -> None:
+    def run_tests(self, test_plan_file: Path, skip_report: bool = False) -> None:
         """
         Execute test plan with OMB.
 
@@ -670,6 +919,8 @@ class Orchestrator:
 
         Args:
             test_plan_file: Path to test plan YAML
+            skip_report: Don't generate the HTML report (it is also skipped when no
+                stage produced results)
         """
         logger.info("="*60)
         logger.info("RUNNING BENCHMARK TESTS")
@@ -680,6 +931,7 @@ class Orchestrator:
         # Create results directory
         results_dir = self.experiment_dir / "benchmark_results"
         results_dir.mkdir(exist_ok=True)
+        self._result_files = None
 
         # Collect cluster topology info (snapshot at test start)
         logger.info("Collecting cluster topology...")
@@ -698,8 +950,10 @@ class Orchestrator:
                 logger.info("Running all stages in single Job for improved efficiency")
                 logger.info("="*60)
 
-                with Live(self._create_layout(), refresh_per_second=2, console=self.console) as live:
-                    self.batch_executor.run_batch_tests(test_plan, live, self._generate_workload)
+                with Live(self._create_layout(), auto_refresh=False, console=self.console) as live:
+                    self.batch_executor.run_batch_tests(
+                        test_plan, live, self._generate_workload, generate_report=not skip_report
+                    )
                 return
 
         # Fall back to standard single-job-per-stage mode
@@ -710,65 +964,83 @@ class Orchestrator:
         plateau_enabled = plateau_config.get('enabled', False)
         allowed_deviation = plateau_config.get('allowed_deviation', 10.0)
         consecutive_fails_allowed = plateau_config.get('consecutive_fails_allowed', 2)
+        min_steps = plateau_config.get('min_steps', 0)
 
         if plateau_enabled:
             logger.info(f"Plateau detection ENABLED:")
             logger.info(f"  - Allowed deviation from target: {allowed_deviation}%")
             logger.info(f"  - Consecutive steps required: {consecutive_fails_allowed}")
+            if min_steps:
+                logger.info(f"  - Minimum steps before detection: {min_steps}")
 
-        # Track throughput history for plateau detection
-        throughput_history: List[float] = []
-        target_rates: List[float] = []
+        # Track consecutive deviating steps and best throughput for plateau detection
+        plateau_tracker = PlateauTracker(allowed_deviation, consecutive_fails_allowed, min_steps)
         plateau_detected = False
-        max_throughput = 0.0
-        max_throughput_step = ""
+
+        # Parsed results kept in memory so the report doesn't re-read them from disk
+        collected_results: Dict[str, Dict] = {}
+
+        # Loop invariants
+        test_runs = test_plan['test_runs']
+        total_tests = len(test_runs)
+        base_workload = test_plan['base_workload']
 
         # Run tests with Rich Live display
-        with Live(self._create_layout(), refresh_per_second=2, console=self.console) as live:
+        with Live(self._create_layout(), auto_refresh=False, console=self.console) as live:
+            # Warm the worker pool once for the whole plan, sized for the largest test
+            max_workers = max((run.get('num_workers', 3) for run in test_runs), default=0)
+            if max_workers:
+                try:
+                    self._prepare_workers(max_workers, live)
+                except OrchestratorError as e:
+                    logger.warning(f"Worker pre-warm failed, tests will retry individually: {e}")
+
             # Run each test
-            for idx, test_run in enumerate(test_plan['test_runs']):
+            for idx, test_run in enumerate(test_runs):
                 test_name = test_run['name']
                 logger.info(f"\n{'='*60}")
-                logger.info(f"Test {idx + 1}/{len(test_plan['test_runs'])}: {test_name}")
+                logger.info(f"Test {idx + 1}/{total_tests}: {test_name}")
                 logger.info(f"{'='*60}\n")
 
                 # Generate workload
-                workload = self._generate_workload(test_plan['base_workload'], test_run)
+                workload = self._generate_workload(base_workload, test_run)
 
                 # Run OMB job
                 try:
                     # Run test (results are saved by results_collector.collect_job_logs())
-                    self.run_omb_job(test_run, workload, live)
+                    results_json = self.run_omb_job(test_run, workload, live)
 
                     # Results are already saved by results_collector.collect_job_logs()
-                    # to benchmark_results/{test_name}.json
+                    # to benchmark_results/{test_name}.json - reuse the returned copy
                     result_file = results_dir / f"{test_name}.json"
+                    result_data = None
+                    if results_json:
+                        try:
+                            result_data = parse_result_json(results_json)
+                            collected_results[test_name] = result_data
+                        except json.JSONDecodeError as e:
+                            logger.warning(f"Could not parse results for {test_name}: {e}")
 
                     self._add_status(f"✓ Test '{test_name}' completed", 'success')
-                    live.update(self._create_layout())
+                    self._refresh_live(live)
                     logger.info(f"✓ Test '{test_name}' completed")
 
-                    if result_file.exists():
+                    if result_data is not None:
                         logger.info(f"Results: {result_file}")
 
                         # Extract throughput for plateau detection
                         if plateau_enabled:
-                            throughput = extract_avg_throughput(result_file)
+                            throughput = average_publish_rate(result_data)
                             target_rate = test_run.get('producer_rate', 0)
                             if throughput is not None and target_rate > 0:
-                                throughput_history.append(throughput)
-                                target_rates.append(float(target_rate))
                                 logger.info(f"  Target rate: {target_rate:,} msgs/sec")
                                 logger.info(f"  Achieved throughput: {throughput:,.0f} msgs/sec")
 
-                                # Track maximum throughput
-                                if throughput > max_throughput:
-                                    max_throughput = throughput
-                                    max_throughput_step = test_name
-
-                                # Check for plateau
-                                if check_plateau(throughput_history, target_rates, allowed_deviation, consecutive_fails_allowed):
+                                # Track maximum throughput and check for plateau
+                                if plateau_tracker.update(test_name, throughput, float(target_rate)):
                                     plateau_detected = True
+                                    max_throughput = plateau_tracker.max_throughput
+                                    max_throughput_step = plateau_tracker.max_throughput_step
                                     logger.info("="*60)
                                     logger.info("PLATEAU DETECTED!")
                                     logger.info(f"Achieved throughput deviated >{allowed_deviation}% from target for {consecutive_fails_allowed} consecutive steps")
@@ -776,14 +1048,14 @@ class Orchestrator:
                                     logger.info("Stopping test run early and generating report...")
                                     logger.info("="*60)
                                     self._add_status(f"🎯 Plateau detected at {max_throughput:,.0f} msgs/sec", 'success')
-                                    live.update(self._create_layout())
+                                    self._refresh_live(live)
                                     break
                     else:
                         logger.warning(f"Results file not found: {result_file}")
 
                 except OrchestratorError as e:
                     self._add_status(f"✗ Test '{test_name}' failed: {e}", 'error')
-                    live.update(self._create_layout())
+                    self._refresh_live(live)
                     logger.error(f"Test '{test_name}' failed: {e}")
                     continue
 
@@ -797,11 +1069,18 @@ class Orchestrator:
         else:
             logger.info(f"\n{'='*60}")
             logger.info(f"ALL TESTS COMPLETED")
-            if throughput_history:
-                logger.info(f"Maximum throughput: {max(throughput_history):,.0f} msgs/sec")
+            if plateau_tracker.max_throughput_step:
+                logger.info(f"Maximum throughput: {plateau_tracker.max_throughput:,.0f} msgs/sec")
             logger.info(f"Results: {results_dir}")
             logger.info(f"{'='*60}\n")
 
+        if skip_report or not collected_results:
+            reason = "--skip-report" if skip_report else "no stage produced results"
+            self.console.print(f"\n[yellow]Report skipped ({reason})[/yellow]")
+            self.console.print(f"[dim]Raw results: {results_dir}[/dim]")
+            self.console.print(f"[dim]Generate later with: orchestrator.py report --experiment-id {self.experiment_id}[/dim]\n")
+            return
+
         # Generate HTML report using existing report generator
         self.console.print("\n[bold cyan]Generating test report...[/bold cyan]")
 
@@ -809,7 +1088,7 @@ class Orchestrator:
         report_gen = ReportGenerator(self.experiment_dir, self.experiment_id)
 
         # Get all result files (filter out workload config files)
-        result_files = [f for f in results_dir.glob("*.json") if not f.name.endswith("_workload.json")]
+        result_files = self._get_result_files(results_dir)
 
         if result_files:
             # Generate full report package with updated namespace info
@@ -827,6 +1106,7 @@ class Orchestrator:
                 cost_data=None,  # No cost data for test runs (only for full experiments)
                 config=report_config,
                 include_raw_data=False,  # Don't duplicate - files already in benchmark_results/
+                preloaded_results=collected_results,
             )
             self.console.print(f"[bold green]✓ Report generated:[/bold green] {report_dir}\n")
             self.console.print(f"[dim]Raw results: {results_dir}[/dim]\n")
@@ -838,40 +1118,74 @@ class Orchestrator:
         # Use 'python scripts/orchestrator.py cleanup-workers' to manually clean up workers
         # self.k8s_manager.cleanup_namespace()
 
-    def _generate_workload(self, base: Dict, overrides: Dict) -> Dict:
-        """Generate OMB workload from test plan"""
-        workload = {
-            'name': overrides.get('name', base['name']),
-            'topics': overrides.get('workload_overrides', {}).get('topics', base['topics']),
-            'partitionsPerTopic': overrides.get('workload_overrides', {}).get('partitions_per_topic', base['partitions_per_topic']),
+    def _get_result_files(self, results_dir: Path) -> List[Path]:
+        """
+        List result files once per Orchestrator, sorted by name.
+
+        run_tests and generate_report share the listing instead of each scanning the
+        results directory. run_tests clears it before writing new results.
+        """
+        if self._result_files is None:
+            from report_generator import list_result_files
+            self._result_files = sorted(list_result_files(results_dir))
+        return self._result_files
+
+    @staticmethod
+    def _build_base_template(base: Dict) -> Dict:
+        """Build the parts of an OMB workload that depend only on the base workload."""
+        template = {
+            'name': base['name'],
+            'topics': base['topics'],
+            'partitionsPerTopic': base['partitions_per_topic'],
             'useRandomizedPayloads': True,
             'randomBytesRatio': 0,
             'randomizedPayloadPoolSize': 1,
             'subscriptionsPerTopic': base.get('subscriptions_per_topic', 1),
-            'consumerPerSubscription': overrides.get('workload_overrides', {}).get('consumers_per_topic', base.get('consumers_per_topic', 1)),
-            'producersPerTopic': overrides.get('workload_overrides', {}).get('producers_per_topic', base.get('producers_per_topic', 1)),
+            'consumerPerSubscription': base.get('consumers_per_topic', 1),
+            'producersPerTopic': base.get('producers_per_topic', 1),
             'consumerBacklogSizeGB': base.get('consumer_backlog_size_gb', 0),
-            'testDurationMinutes': overrides.get('workload_overrides', {}).get('test_duration_minutes', base.get('test_duration_minutes', 5)),
-            'warmupDurationMinutes': overrides.get('workload_overrides', {}).get('warmup_duration_minutes', base.get('warmup_duration_minutes', 1)),
+            'testDurationMinutes': base.get('test_duration_minutes', 5),
+            'warmupDurationMinutes': base.get('warmup_duration_minutes', 1),
         }
 
-        # Handle message size - either fixed size or distribution (mutually exclusive)
-        override_distribution = overrides.get('workload_overrides', {}).get('message_size_distribution')
-        override_size = overrides.get('workload_overrides', {}).get('message_size')
+        # Message size - either fixed size or distribution (mutually exclusive)
         base_distribution = base.get('message_size_distribution')
         base_size = base.get('message_size')
-
-        if override_distribution:
-            workload['messageSizeDistribution'] = override_distribution
-        elif override_size:
-            workload['messageSize'] = override_size
-        elif base_distribution:
-            workload['messageSizeDistribution'] = base_distribution
+        if base_distribution:
+            template['messageSizeDistribution'] = base_distribution
         elif base_size:
-            workload['messageSize'] = base_size
+            template['messageSize'] = base_size
         else:
             # Default to 1KB if nothing specified
-            workload['messageSize'] = 1024
+            template['messageSize'] = 1024
+
+        return template
+
+    def _generate_workload(self, base: Dict, overrides: Dict) -> Dict:
+        """Generate OMB workload from test plan"""
+        # The base template is built once per base workload and copied for each stage
+        if self._workload_template is None or self._workload_template[0] is not base:
+            self._workload_template = (base, self._build_base_template(base))
+        workload = self._workload_template[1].copy()
+
+        if 'name' in overrides:
+            workload['name'] = overrides['name']
+
+        wo = overrides.get('workload_overrides')
+        if wo:
+            for override_key, workload_key in WORKLOAD_OVERRIDE_KEYS:
+                if override_key in wo:
+                    workload[workload_key] = wo[override_key]
+
+            # Overridden message size replaces whichever form the base used
+            override_distribution = wo.get('message_size_distribution')
+            override_size = wo.get('message_size')
+            if override_distribution:
+                workload.pop('messageSize', None)
+                workload['messageSizeDistribution'] = override_distribution
+            elif override_size:
+                workload.pop('messageSizeDistribution', None)
+                workload['messageSize'] = override_size
 
         # Set producer rate based on test type
         if overrides['type'] == 'fixed_rate' and 'producer_rate' in overrides:
@@ -897,7 +1211,7 @@ class Orchestrator:
             return
 
         # Filter out workload config files from result files
-        result_files = [f for f in results_dir.glob("*.json") if not f.name.endswith("_workload.json")]
+        result_files = self._get_result_files(results_dir)
         if not result_files:
             logger.error(f"No result files found in {results_dir}")
             logger.error("Expected JSON files from OMB tests")
@@ -945,10 +1259,14 @@ class Orchestrator:
     def resolve_experiment_id(experiment_id: str) -> str:
         """Resolve experiment ID, handling 'latest' shortcut"""
         if experiment_id == "latest":
-            latest_link = RESULTS_DIR / "latest"
-            if not latest_link.exists():
+            # readlink instead of resolve(); the target is still checked, since readlink
+            # succeeds on a dangling link left by a deleted experiment
+            try:
+                experiment_id = os.path.basename(os.readlink(RESULTS_DIR / "latest"))
+            except OSError:
+                raise OrchestratorError("No experiments found")
+            if not (RESULTS_DIR / experiment_id).is_dir():
                 raise OrchestratorError("No experiments found")
-            return latest_link.resolve().name
         return experiment_id
 
     @staticmethod
@@ -958,26 +1276,32 @@ class Orchestrator:
             print("No experiments found.")
             return
 
-        experiments = sorted(
-            [d for d in RESULTS_DIR.iterdir() if d.is_dir() and d.name.startswith("exp-")],
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
-        )
+        # One scandir pass: DirEntry caches the type from readdir and its stat() result,
+        # so each experiment costs a single stat shared by sorting and display
+        with os.scandir(RESULTS_DIR) as entries:
+            experiments = [
+                (entry.name, entry.stat().st_mtime)
+                for entry in entries
+                if entry.name.startswith("exp-") and entry.is_dir()
+            ]
+        experiments.sort(key=lambda exp: exp[1], reverse=True)
 
         if not experiments:
             print("No experiments found.")
             return
 
+        # Read the "latest" symlink once rather than resolving it per experiment
+        try:
+            latest_id = os.path.basename(os.readlink(RESULTS_DIR / "latest"))
+        except OSError:
+            latest_id = None
+
         print("\nAvailable Experiments:")
         print("=" * 60)
-        for exp_dir in experiments:
-            exp_id = exp_dir.name
-            timestamp = datetime.fromtimestamp(exp_dir.stat().st_mtime)
+        for exp_id, mtime in experiments:
+            timestamp = datetime.fromtimestamp(mtime)
 
-            is_latest = ""
-            latest_link = RESULTS_DIR / "latest"
-            if latest_link.exists() and latest_link.resolve() == exp_dir:
-                is_latest = " (latest)"
+            is_latest = " (latest)" if exp_id == latest_id else ""
 
             print(f"{exp_id:30} {timestamp.strftime('%Y-%m-%d %H:%M:%S')}{is_latest}")
         print("=" * 60)
@@ -1016,11 +1340,11 @@ def main():
         if experiment_id:
             experiment_id = Orchestrator.resolve_experiment_id(experiment_id)
 
-        orchestrator = Orchestrator(experiment_id)
+        orchestrator = Orchestrator(experiment_id, debug_artifacts=getattr(args, "debug_artifacts", False))
 
         # Execute command
         if args.command == "run":
-            orchestrator.run_tests(args.test_plan)
+            orchestrator.run_tests(args.test_plan, skip_report=args.skip_report)
         elif args.command == "report":
             orchestrator.generate_report()
 
@@ -5,15 +5,63 @@ Handles Pulsar tenant/namespace operations, topic cleanup, and namespace detecti
 
 import logging
 import re
-from typing import Optional, Callable
+import time
+from typing import Callable, List, Optional, Tuple
 
 from rich.live import Live
 
+from operations import bulk_delete_topics
+
 logger = logging.getLogger(__name__)
 
 # Default Pulsar test namespace
 PULSAR_TEST_NAMESPACE = "public/omb-test"
 
+# Command prefix for running inside the broker pod
+PULSAR_BROKER_EXEC = ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--"]
+
+# pulsar-admin invocation inside the broker pod; callers append the subcommand
+PULSAR_ADMIN_CMD = [*PULSAR_BROKER_EXEC, "bin/pulsar-admin"]
+
+# Max concurrent pulsar-admin calls per sweep in wait_for_namespace_with_topics
+NAMESPACE_SCAN_WORKERS = 8
+
+# How long ensure_pulsar_namespace_exists reuses a `namespaces list public` result
+NAMESPACE_LIST_TTL_SECONDS = 30.0
+
+# Default max concurrent pulsar-admin calls (inside the broker pod) when deleting topics
+TOPIC_DELETE_WORKERS = 8
+
+# Worker log line announcing the test namespace: "Created Pulsar namespace public/omb-test-xxxxx"
+# The random suffix is 5 Base64URL characters (letters, numbers, _, -)
+_CREATED_NAMESPACE_RE = re.compile(r'Created Pulsar namespace (public/omb-test-[A-Za-z0-9_-]+)')
+
+# One topic name per line in `topics list` output; kubectl's "Defaulted container" notice
+# and other noise never match
+_TOPIC_LINE_RE = re.compile(r'^\s*(persistent://\S+)\s*$', re.MULTILINE)
+
+
+# Lists regular and partitioned topics of namespace $1 concurrently in one exec. Prints the
+# regular list, a marker line carrying list-partitioned-topics' exit status, then the
+# partitioned list; exits with the regular list's status.
+_PARTITIONED_MARKER = "---PARTITIONED---"
+_LIST_TOPICS_SCRIPT = (
+    'd=$(mktemp -d); '
+    'bin/pulsar-admin topics list "$1" >"$d/regular" 2>"$d/err" & r=$!; '
+    'bin/pulsar-admin topics list-partitioned-topics "$1" >"$d/partitioned" 2>/dev/null & p=$!; '
+    'wait $r; rs=$?; wait $p; ps=$?; '
+    'cat "$d/regular"; '
+    f'echo "{_PARTITIONED_MARKER} $ps"; '
+    'cat "$d/partitioned"; '
+    'cat "$d/err" >&2; rm -rf "$d"; '
+    'exit $rs'
+)
+
+
+def _parse_topic_list(output: str) -> List[str]:
+    """Extract topic names from pulsar-admin `topics list` / `list-partitioned-topics` output."""
+    return _TOPIC_LINE_RE.findall(output)
+
 
 class PulsarManager:
     """Manages Pulsar-specific operations."""
@@ -23,7 +71,8 @@ class PulsarManager:
         pulsar_namespace: str,
         run_command_func: Callable,
         add_status_func: Optional[Callable] = None,
-        create_layout_func: Optional[Callable] = None
+        refresh_live_func: Optional[Callable] = None,
+        max_delete_workers: int = TOPIC_DELETE_WORKERS
     ):
         """
         Initialize Pulsar manager.
@@ -32,41 +81,66 @@ class PulsarManager:
             pulsar_namespace: Pulsar tenant/namespace (e.g., 'public/omb-test')
             run_command_func: Function to run kubectl commands
             add_status_func: Optional function to add UI status messages
-            create_layout_func: Optional function to create UI layout
+            refresh_live_func: Optional function to redraw a Live display
+            max_delete_workers: Max concurrent topic deletions during cleanup
         """
         self.pulsar_tenant_namespace = pulsar_namespace
         self.run_command = run_command_func
         self._add_status = add_status_func
-        self._create_layout = create_layout_func
+        self._refresh_live = refresh_live_func
+        self.max_delete_workers = max_delete_workers
+
+        # (monotonic timestamp, namespaces) from the last `namespaces list public`
+        self._ns_list_cache: Optional[Tuple[float, List[str]]] = None
+
+    def _list_public_namespaces(self, max_age: float = NAMESPACE_LIST_TTL_SECONDS) -> Optional[List[str]]:
+        """
+        List namespaces in the public tenant, reusing a recent result.
+
+        Args:
+            max_age: Maximum age in seconds of a cached listing to reuse
+
+        Returns:
+            Namespace names like 'public/omb-test-xxxxx', or None if listing fails
+        """
+        if self._ns_list_cache and time.monotonic() - self._ns_list_cache[0] < max_age:
+            return self._ns_list_cache[1]
 
-    def ensure_pulsar_namespace_exists(self) -> None:
-        """Ensure the Pulsar tenant/namespace for tests exists."""
-        # Check if namespace exists
         result = self.run_command(
-            ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-             "bin/pulsar-admin", "namespaces", "list", "public"],
-            f"List Pulsar namespaces in public tenant",
+            [*PULSAR_ADMIN_CMD, "namespaces", "list", "public"],
+            "List Pulsar namespaces in public tenant",
             capture_output=True,
             check=False
         )
+        if result.returncode != 0:
+            return None
 
-        if result.returncode == 0:
-            namespaces = [line.strip().strip('"') for line in result.stdout.strip().split('\n')
-                         if line.strip() and line.strip().startswith('public/')]
+        namespaces = []
+        for line in result.stdout.strip().split('\n'):
+            line = line.strip().strip('"')
+            if line.startswith('public/') and 'Defaulted container' not in line:
+                namespaces.append(line)
 
-            if self.pulsar_tenant_namespace in namespaces:
-                logger.debug(f"Pulsar namespace '{self.pulsar_tenant_namespace}' already exists")
-                return
+        self._ns_list_cache = (time.monotonic(), namespaces)
+        return namespaces
+
+    def ensure_pulsar_namespace_exists(self) -> None:
+        """Ensure the Pulsar tenant/namespace for tests exists."""
+        # Check if namespace exists
+        namespaces = self._list_public_namespaces()
+        if namespaces is not None and self.pulsar_tenant_namespace in namespaces:
+            logger.debug(f"Pulsar namespace '{self.pulsar_tenant_namespace}' already exists")
+            return
 
         # Create the namespace
         logger.info(f"Creating Pulsar namespace: {self.pulsar_tenant_namespace}")
         result = self.run_command(
-            ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-             "bin/pulsar-admin", "namespaces", "create", self.pulsar_tenant_namespace],
+            [*PULSAR_ADMIN_CMD, "namespaces", "create", self.pulsar_tenant_namespace],
             f"Create Pulsar namespace {self.pulsar_tenant_namespace}",
             check=False,
             capture_output=True
         )
+        self._ns_list_cache = None
 
         if result.returncode == 0:
             logger.info(f"✓ Pulsar namespace '{self.pulsar_tenant_namespace}' created")
@@ -76,7 +150,13 @@ class PulsarManager:
             else:
                 logger.warning(f"Failed to create Pulsar namespace: {result.stderr}")
 
-    def detect_pulsar_namespace_from_logs(self, test_name: str, namespace: str = "omb") -> Optional[str]:
+    def detect_pulsar_namespace_from_logs(
+        self,
+        test_name: str,
+        namespace: str = "omb",
+        since_seconds: Optional[int] = None,
+        warn_if_missing: bool = True
+    ) -> Optional[str]:
         """
         Detect Pulsar namespace by reading OMB worker pod logs.
 
@@ -86,6 +166,9 @@ class PulsarManager:
         Args:
             test_name: Name of the test (not used, kept for compatibility)
             namespace: Kubernetes namespace where workers run
+            since_seconds: Only read log lines newer than this, so a namespace logged
+                by a previous test on the persistent workers is not picked up
+            warn_if_missing: Log a warning when no namespace is found (disable when polling)
 
         Returns:
             Namespace string like 'public/omb-test-7Wv9Uqc' or None
@@ -97,8 +180,12 @@ class PulsarManager:
 
                 logger.debug(f"Checking {pod_name} logs for namespace...")
 
+                log_cmd = ["kubectl", "logs", pod_name, "-n", namespace, "--tail=200"]
+                if since_seconds is not None:
+                    log_cmd.append(f"--since={since_seconds}s")
+
                 result = self.run_command(
-                    ["kubectl", "logs", pod_name, "-n", namespace, "--tail=200"],
+                    log_cmd,
                     f"Get logs from {pod_name}",
                     capture_output=True,
                     check=False
@@ -108,17 +195,15 @@ class PulsarManager:
                     logger.debug(f"Could not get logs from {pod_name}, trying next worker")
                     continue
 
-                # Look for: "Created Pulsar namespace public/omb-test-xxxxx"
-                # The random suffix is 5 Base64URL characters (letters, numbers, _, -)
-                pattern = r'Created Pulsar namespace (public/omb-test-[A-Za-z0-9_-]+)'
-                match = re.search(pattern, result.stdout)
+                match = _CREATED_NAMESPACE_RE.search(result.stdout)
 
                 if match:
                     detected_ns = match.group(1)
                     logger.info(f"✓ Detected Pulsar namespace from {pod_name}: {detected_ns}")
                     return detected_ns
 
-            logger.warning("Could not find namespace in any worker pod logs")
+            if warn_if_missing:
+                logger.warning("Could not find namespace in any worker pod logs")
             return None
 
         except Exception as e:
@@ -137,27 +222,15 @@ class PulsarManager:
         """
         logger.info("Detecting Pulsar namespace from topic URLs...")
 
-        # List all namespaces to find omb-test candidates
-        result = self.run_command(
-            ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-             "bin/pulsar-admin", "namespaces", "list", "public"],
-            "List Pulsar namespaces",
-            capture_output=True,
-            check=False
-        )
-
-        if result.returncode != 0:
+        # List all namespaces to find omb-test candidates; always fresh, since the
+        # per-run namespace OMB just created won't be in a cached listing
+        namespaces = self._list_public_namespaces(max_age=0)
+        if namespaces is None:
             logger.warning("Failed to list Pulsar namespaces")
             return None
 
         # Find omb-test namespaces
-        lines = result.stdout.strip().split('\n')
-        omb_namespaces = []
-
-        for line in lines:
-            line = line.strip().strip('"')
-            if line.startswith('public/omb-test-') and 'Defaulted container' not in line:
-                omb_namespaces.append(line)
+        omb_namespaces = [ns for ns in namespaces if ns.startswith('public/omb-test-')]
 
         if not omb_namespaces:
             logger.warning("No omb-test namespaces found")
@@ -171,17 +244,14 @@ class PulsarManager:
             logger.debug(f"Checking {ns} for topics...")
 
             result = self.run_command(
-                ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-                 "bin/pulsar-admin", "topics", "list", ns],
+                [*PULSAR_ADMIN_CMD, "topics", "list", ns],
                 f"List topics in {ns}",
                 capture_output=True,
                 check=False
             )
 
             if result.returncode == 0:
-                topics = [line.strip() for line in result.stdout.strip().split('\n')
-                         if line.strip() and line.strip().startswith('persistent://')
-                         and 'Defaulted container' not in line]
+                topics = _parse_topic_list(result.stdout)
 
                 if topics:
                     logger.info(f"✓ Found active Pulsar namespace with {len(topics)} topic(s): {ns}")
@@ -192,6 +262,50 @@ class PulsarManager:
         logger.warning(f"Found {len(omb_namespaces)} omb-test namespace(s) but none have topics yet")
         return None
 
+    def wait_for_namespace_with_topics(self, timeout: int = 60, poll_interval: int = 2) -> Optional[str]:
+        """
+        Wait for an omb-test namespace to get topics, returning as soon as one does.
+
+        Runs the whole wait as one shell loop inside the broker pod, so there is a single
+        kubectl exec instead of one round of admin calls per retry. Each sweep checks all
+        omb-test namespaces concurrently and picks the newest one with topics, matching
+        detect_pulsar_namespace_from_topics().
+
+        Args:
+            timeout: Maximum seconds to wait
+            poll_interval: Seconds between sweeps inside the pod
+
+        Returns:
+            Namespace string like 'public/omb-test-7Wv9Uqc' or None on timeout
+        """
+        logger.info(f"Waiting up to {timeout}s for an omb-test namespace with topics...")
+
+        script = (
+            f"end=$(( $(date +%s) + {timeout} )); "
+            "while [ $(date +%s) -lt $end ]; do "
+            "found=$(bin/pulsar-admin namespaces list public 2>/dev/null | tr -d '\"' | grep '^public/omb-test-' "
+            f"| xargs -r -P {NAMESPACE_SCAN_WORKERS} -I{{}} sh -c "
+            "'bin/pulsar-admin topics list \"$1\" 2>/dev/null | grep -q persistent:// && echo \"$1\"' _ {}); "
+            "if [ -n \"$found\" ]; then echo \"$found\" | sort -r | head -n 1; exit 0; fi; "
+            f"sleep {poll_interval}; "
+            "done; exit 1"
+        )
+
+        result = self.run_command(
+            [*PULSAR_BROKER_EXEC, "sh", "-c", script],
+            "Wait for Pulsar namespace with topics",
+            capture_output=True,
+            check=False,
+            timeout=timeout + 60  # Allow for pulsar-admin JVM startup in the final sweep
+        )
+
+        detected_ns = result.stdout.strip().splitlines()[-1].strip() if result.returncode == 0 and result.stdout.strip() else None
+        if detected_ns:
+            logger.info(f"✓ Found active Pulsar namespace with topics: {detected_ns}")
+        else:
+            logger.warning(f"No omb-test namespace with topics after {timeout}s")
+        return detected_ns
+
     def detect_pulsar_namespace(self) -> Optional[str]:
         """
         Detect active Pulsar namespace matching omb-test pattern.
@@ -204,132 +318,195 @@ class PulsarManager:
         """
         return self.detect_pulsar_namespace_from_topics()
 
-    def cleanup_test_topics(self, live: Optional[Live] = None) -> None:
-        """Delete all topics in the Pulsar test namespace."""
-        if live and self._add_status and self._create_layout:
+    def cleanup_test_topics(self, live: Optional[Live] = None, drop_namespace: bool = False) -> None:
+        """
+        Delete all topics in the Pulsar test namespace.
+
+        Args:
+            live: Optional Rich Live display for status updates
+            drop_namespace: If the namespace is a per-run OMB namespace (public/omb-test-xxxxx),
+                first try `namespaces delete --force`, which drops it and all its topics
+                broker-side in one call. Falls back to listing and deleting topics if the
+                broker rejects it.
+        """
+        if live and self._add_status and self._refresh_live:
             self._add_status(f"Cleaning up topics in {self.pulsar_tenant_namespace}...", 'info')
-            live.update(self._create_layout())
+            self._refresh_live(live)
+
+        if drop_namespace and not self._is_run_namespace():
+            logger.info(f"'{self.pulsar_tenant_namespace}' is not a per-run OMB namespace, "
+                        f"skipping namespace force delete")
+        elif drop_namespace and self._force_delete_run_namespace():
+            if live and self._add_status and self._refresh_live:
+                self._add_status(f"✓ Dropped {self.pulsar_tenant_namespace} and its topics", 'success')
+                self._refresh_live(live)
+            return
 
         logger.info(f"Cleaning up Pulsar topics in namespace '{self.pulsar_tenant_namespace}'...")
 
-        # List topics
-        result = self.run_command(
-            ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-             "bin/pulsar-admin", "topics", "list", self.pulsar_tenant_namespace],
-            f"List topics in {self.pulsar_tenant_namespace}",
-            check=False,
-            capture_output=True
-        )
-
-        if result.returncode != 0:
-            logger.warning(f"Failed to list topics: {result.stderr}")
-            if live and self._add_status and self._create_layout:
+        # List regular and partitioned topics (partitioned topics don't show up in the
+        # regular topics list) in one exec
+        listing = self._list_namespace_topics(self.pulsar_tenant_namespace)
+        if listing is None:
+            if live and self._add_status and self._refresh_live:
                 self._add_status("⚠ Failed to list topics for cleanup", 'warning')
-                live.update(self._create_layout())
+                self._refresh_live(live)
             return
 
-        # Parse topics
-        topics = [line.strip() for line in result.stdout.strip().split('\n')
-                 if line.strip() and line.strip().startswith('persistent://')
-                 and 'Defaulted container' not in line]
+        topics, partitioned_topics = listing
 
         if not topics:
             logger.info(f"No topics to delete in '{self.pulsar_tenant_namespace}'")
-            if live and self._add_status and self._create_layout:
+            if live and self._add_status and self._refresh_live:
                 self._add_status("✓ No topics to clean up", 'success')
-                live.update(self._create_layout())
+                self._refresh_live(live)
             return
 
         logger.info(f"Found {len(topics)} topic(s) to delete")
 
         # Delete topics
-        topics_deleted = 0
-        for topic_url in topics:
-            result = self.run_command(
-                ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-                 "bin/pulsar-admin", "topics", "delete", topic_url, "-f"],
-                f"Delete topic {topic_url.split('/')[-1]}",
-                check=False,
-                capture_output=True
-            )
-
-            if result.returncode == 0:
-                topics_deleted += 1
-                logger.debug(f"  ✓ Deleted: {topic_url.split('/')[-1]}")
-            else:
-                logger.warning(f"  ✗ Failed to delete {topic_url.split('/')[-1]}: {result.stderr}")
+        topics_deleted = self._delete_topics(topics)
 
         logger.info(f"✓ Deleted {topics_deleted}/{len(topics)} regular topic(s)")
 
-        # List and delete partitioned topics (they don't show up in regular topics list)
-        partitioned_result = self.run_command(
-            ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-             "bin/pulsar-admin", "topics", "list-partitioned-topics", self.pulsar_tenant_namespace],
-            f"List partitioned topics in {self.pulsar_tenant_namespace}",
-            check=False,
-            capture_output=True
-        )
-
+        # Delete partitioned topics
         partitioned_deleted = 0
-        if partitioned_result.returncode == 0:
-            partitioned_topics = [line.strip() for line in partitioned_result.stdout.strip().split('\n')
-                                 if line.strip() and line.strip().startswith('persistent://')
-                                 and 'Defaulted container' not in line]
-
-            if partitioned_topics:
-                logger.info(f"Found {len(partitioned_topics)} partitioned topic(s) to delete")
-                for topic_url in partitioned_topics:
-                    result = self.run_command(
-                        ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-                         "bin/pulsar-admin", "topics", "delete-partitioned-topic", topic_url, "-f"],
-                        f"Delete partitioned topic {topic_url.split('/')[-1]}",
-                        check=False,
-                        capture_output=True
-                    )
-
-                    if result.returncode == 0:
-                        partitioned_deleted += 1
-                        logger.debug(f"  ✓ Deleted partitioned: {topic_url.split('/')[-1]}")
-                    else:
-                        logger.warning(f"  ✗ Failed to delete partitioned {topic_url.split('/')[-1]}: {result.stderr}")
-
-                logger.info(f"✓ Deleted {partitioned_deleted}/{len(partitioned_topics)} partitioned topic(s)")
+        if partitioned_topics:
+            logger.info(f"Found {len(partitioned_topics)} partitioned topic(s) to delete")
+            partitioned_deleted = self._delete_topics(partitioned_topics, partitioned=True)
+
+            logger.info(f"✓ Deleted {partitioned_deleted}/{len(partitioned_topics)} partitioned topic(s)")
 
         total_deleted = topics_deleted + partitioned_deleted
-        if live and self._add_status and self._create_layout:
+        if live and self._add_status and self._refresh_live:
             self._add_status(f"✓ Cleaned up {total_deleted} topic(s) ({topics_deleted} regular, {partitioned_deleted} partitioned)", 'success')
-            live.update(self._create_layout())
+            self._refresh_live(live)
 
         # Cleanup namespace
         self.cleanup_pulsar_namespace(live)
 
+    def _list_namespace_topics(self, ns: str) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        List a namespace's regular and partitioned topics with one kubectl exec.
+
+        Both pulsar-admin listings run concurrently inside the broker pod.
+
+        Args:
+            ns: Pulsar namespace (tenant/namespace)
+
+        Returns:
+            (regular topics, partitioned topics), or None if the regular listing failed.
+            Partitioned topics are empty if only that listing failed.
+        """
+        result = self.run_command(
+            [*PULSAR_BROKER_EXEC, "sh", "-c", _LIST_TOPICS_SCRIPT, "_", ns],
+            f"List topics in {ns}",
+            check=False,
+            capture_output=True
+        )
+
+        if result.returncode != 0:
+            logger.warning(f"Failed to list topics: {result.stderr}")
+            return None
+
+        regular_out, _, partitioned_out = result.stdout.partition(_PARTITIONED_MARKER)
+        status_line, _, partitioned_out = partitioned_out.partition("\n")
+        partitioned = _parse_topic_list(partitioned_out) if status_line.strip() == "0" else []
+
+        return _parse_topic_list(regular_out), partitioned
+
+    def _delete_topics(self, topics: List[str], partitioned: bool = False) -> int:
+        """
+        Delete topics with a single kubectl exec into the broker pod.
+
+        Uses operations.bulk_delete_topics (up to max_delete_workers deletes at a time
+        inside the pod) and logs each topic's outcome.
+
+        Args:
+            topics: Full topic names (persistent://tenant/namespace/topic)
+            partitioned: Use delete-partitioned-topic instead of delete
+
+        Returns:
+            Number of topics deleted
+        """
+        kind = "partitioned topic" if partitioned else "topic"
+        logger.info(f"Running: Delete {len(topics)} {kind}(s)")
+
+        def log_result(topic_url: str, success: bool, reason: str) -> None:
+            short_name = topic_url.split('/')[-1]
+            if success:
+                logger.debug(f"  ✓ Deleted {kind}: {short_name}")
+            else:
+                logger.warning(f"  ✗ Failed to delete {kind} {short_name}: {reason or 'unknown error'}")
+
+        deleted, _ = bulk_delete_topics(
+            topics,
+            partitioned=partitioned,
+            parallelism=self.max_delete_workers,
+            on_result=log_result
+        )
+        return deleted
+
+    def _is_run_namespace(self) -> bool:
+        """Whether the current namespace is a per-run OMB namespace (public/omb-test-xxxxx)."""
+        ns = self.pulsar_tenant_namespace
+        return bool(ns) and ns.startswith(f"{PULSAR_TEST_NAMESPACE}-")
+
+    def _force_delete_run_namespace(self) -> bool:
+        """
+        Force-delete the per-run OMB namespace together with its topics.
+
+        Returns:
+            True if the namespace was deleted, False if it isn't a per-run namespace or
+            the broker rejected the force delete
+        """
+        ns = self.pulsar_tenant_namespace
+        if not self._is_run_namespace():
+            return False
+
+        logger.info(f"Force-deleting Pulsar namespace '{ns}' and its topics...")
+        result = self.run_command(
+            [*PULSAR_ADMIN_CMD, "namespaces", "delete", ns, "--force"],
+            f"Force delete Pulsar namespace {ns}",
+            check=False,
+            discard_stdout=True
+        )
+        if result.returncode != 0:
+            logger.debug(f"Force delete of {ns} not available, falling back to per-topic cleanup: "
+                         f"{result.stderr.strip()}")
+            return False
+
+        self._ns_list_cache = None
+        logger.info(f"✓ Pulsar namespace '{ns}' deleted")
+        return True
+
     def cleanup_pulsar_namespace(self, live: Optional[Live] = None) -> None:
         """Delete the Pulsar tenant/namespace."""
         if not self.pulsar_tenant_namespace or self.pulsar_tenant_namespace == PULSAR_TEST_NAMESPACE:
             logger.debug("No specific Pulsar namespace to clean up")
             return
 
-        if live and self._add_status and self._create_layout:
+        if live and self._add_status and self._refresh_live:
             self._add_status(f"Deleting Pulsar namespace {self.pulsar_tenant_namespace}...", 'info')
-            live.update(self._create_layout())
+            self._refresh_live(live)
 
         logger.info(f"Deleting Pulsar namespace '{self.pulsar_tenant_namespace}'...")
 
         result = self.run_command(
-            ["kubectl", "exec", "-n", "pulsar", "pulsar-broker-0", "--",
-             "bin/pulsar-admin", "namespaces", "delete", self.pulsar_tenant_namespace],
+            [*PULSAR_ADMIN_CMD, "namespaces", "delete", self.pulsar_tenant_namespace],
             f"Delete Pulsar namespace {self.pulsar_tenant_namespace}",
             check=False,
-            capture_output=True
+            discard_stdout=True
         )
+        self._ns_list_cache = None
 
         if result.returncode == 0:
             logger.info(f"✓ Pulsar namespace '{self.pulsar_tenant_namespace}' deleted")
-            if live and self._add_status and self._create_layout:
+            if live and self._add_status and self._refresh_live:
                 self._add_status(f"✓ Pulsar namespace deleted", 'success')
-                live.update(self._create_layout())
+                self._refresh_live(live)
         else:
             logger.warning(f"Failed to delete Pulsar namespace: {result.stderr}")
-            if live and self._add_status and self._create_layout:
+            if live and self._add_status and self._refresh_live:
                 self._add_status("⚠ Failed to delete Pulsar namespace", 'warning')
-                live.update(self._create_layout())
+                self._refresh_live(live)
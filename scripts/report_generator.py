@@ -4,35 +4,410 @@ Report Generation Module
 Generates comprehensive HTML reports from benchmark results
 """
 
-import json
+import contextlib
+import csv
+import functools
+import hashlib
 import logging
+import mmap
+import multiprocessing
+import os
+import re
+import shutil
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional
-
-import pandas as pd
-from jinja2 import Environment, FileSystemLoader
-
-# Import chart generation modules
-try:
-    from omb_charts import generate_all_charts
-    CHARTS_AVAILABLE = True
-except ImportError:
-    CHARTS_AVAILABLE = False
-    logging.warning("omb_charts module not available - chart generation disabled")
-
-try:
-    from interactive_charts import generate_all_interactive_charts
-    INTERACTIVE_CHARTS_AVAILABLE = True
-except ImportError:
-    INTERACTIVE_CHARTS_AVAILABLE = False
-    logging.warning("interactive_charts module not available - interactive chart generation disabled")
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from json_io import dumps_indented, load_json
+
+# jinja2 and the chart modules are imported where they are used: callers that only
+# need list_result_files or the parsing helpers (orchestrator, batch executor)
+# shouldn't pay their import time
 
 logger = logging.getLogger(__name__)
 
 # Template directory
 TEMPLATE_DIR = Path(__file__).parent.parent / "reporting" / "templates"
 
+# Static assets (stylesheet) linked from the HTML report
+STATIC_DIR = Path(__file__).parent.parent / "reporting" / "static"
+REPORT_CSS = "report.css"
+
+# Thread count for overlapping per-test file reads (hides filesystem latency on NFS/EFS)
+FILE_IO_WORKERS = 16
+
+# Write buffer for streamed report output
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Template output events joined per chunk when streaming the report (Jinja emits one
+# event per text run/expression; batching them cuts per-chunk encode and write calls)
+TEMPLATE_STREAM_BATCH = 64
+
+# CSV export columns: (column name, metrics section, key within the per-test dict)
+CSV_COLUMNS = [
+    ('avg_publish_rate_msgs_sec', 'throughput', 'publish_rate'),
+    ('max_publish_rate_msgs_sec', 'throughput', 'max_publish_rate'),
+    ('avg_consume_rate_msgs_sec', 'throughput', 'consume_rate'),
+    ('max_consume_rate_msgs_sec', 'throughput', 'max_consume_rate'),
+    ('latency_p50_ms', 'latency', 'p50'),
+    ('latency_p95_ms', 'latency', 'p95'),
+    ('latency_p99_ms', 'latency', 'p99'),
+    ('latency_p999_ms', 'latency', 'p999'),
+    ('latency_max_ms', 'latency', 'max'),
+    ('publish_errors', 'errors', 'publish_errors'),
+    ('consume_errors', 'errors', 'consume_errors'),
+]
+
+# Parse result files in worker processes once a report has at least this many; below it,
+# process startup (each worker re-imports this module) costs more than the parallel decode saves
+PROCESS_PARSE_MIN_FILES = 16
+
+# Generate interactive charts in worker processes once a report has at least this many
+# result files (building and serializing Plotly figures is CPU-bound pure Python)
+PROCESS_CHART_MIN_FILES = 4
+
+# Parsed metrics by result file content hash (LRU): regenerating reports in the same
+# process (e.g. per-batch and final reports) and files with identical content are parsed
+# once. Values are the per-section metrics without the test name, see _parse_results_files
+_PARSED_RESULTS_CACHE: "OrderedDict[bytes, Dict]" = OrderedDict()
+PARSED_RESULTS_CACHE_SIZE = 1024
+
+
+@contextlib.contextmanager
+def _atomic_open(path: Path, mode: str = 'wb', **kwargs):
+    """
+    Open path for writing through a temp file that is renamed over it on success.
+
+    A report regenerated over an existing one (or interrupted mid-write) never leaves a
+    truncated file behind; on error the temp file is removed and path is untouched.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _dump_json(data, path: Path) -> None:
+    """Write data as indented JSON (see json_io.dumps_indented) in a single write."""
+    encoded = dumps_indented(data)
+    with _atomic_open(path) as f:
+        f.write(encoded)
+
+
+# Leading stage number of a chart's stage name ("001-rate-100k" -> "001")
+_STAGE_NUMBER_RE = re.compile(r'^(\d+)')
+
+
+def _test_sort_key(test_name: str) -> Tuple[int, str]:
+    """Sort key ordering test names by stage number ("001-rate-100k" before "002-rate-140k")."""
+    prefix = test_name.partition('-')[0]
+    return (int(prefix) if prefix.isdigit() else 999, test_name)
+
+
+def _rate_stats(rates: Sequence[float]) -> Tuple[float, float]:
+    """
+    Average and peak of an OMB periodic rate series, (0, 0) if empty.
+
+    sum()/max() on the decoded list are single C-level passes; for OMB's sample counts
+    (one per reporting interval) converting to an array first would cost more than it saves.
+    """
+    if not rates:
+        return 0, 0
+    return sum(rates) / len(rates), max(rates)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_template_env():
+    """
+    Jinja2 environment shared by every ReportGenerator in the process, or None if
+    the template directory is missing.
+
+    Templates are compiled once and kept (auto_reload off), so generating many
+    reports doesn't recompile report.html each time. Compiled bytecode is also cached
+    on disk (per-user temp dir, keyed by template source checksum), so a fresh process
+    loads it instead of lexing and compiling the template again.
+    """
+    if not TEMPLATE_DIR.exists():
+        return None
+
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+    # Autoescape HTML so test names, paths and config values can't inject markup
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(['html']),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache()
+    )
+
+
+def list_result_files(results_dir: Path) -> List[Path]:
+    """
+    List OMB result files in a benchmark_results directory.
+
+    Uses a single os.scandir pass instead of glob + fnmatch, skipping the
+    *_workload.json config files stored alongside the results.
+
+    Args:
+        results_dir: Directory containing benchmark result JSON files
+
+    Returns:
+        List of result file paths
+    """
+    with os.scandir(results_dir) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith('.json') and not entry.name.endswith('_workload.json')
+        ]
+
+
+def _copy_raw_result(src: Path, dst: Path) -> None:
+    """
+    Copy a raw result file into the report package unless an up-to-date copy exists.
+
+    Result files are never rewritten once OMB finishes, so a hard link is tried first
+    (no data copied at all). Across filesystems it falls back to os.copy_file_range,
+    then shutil.copyfile (sendfile on Linux); neither bounces the bytes through Python.
+    Regenerating a report skips unchanged files.
+    """
+    src_stat = src.stat()
+    try:
+        dst_stat = dst.stat()
+        if dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns >= src_stat.st_mtime_ns:
+            return
+        # Stale copy: remove it so it can be replaced by a link
+        dst.unlink()
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.link(src, dst)
+        return
+    except OSError as e:
+        # EXDEV (different filesystem), EPERM (no hard links on this filesystem), etc.
+        logger.debug(f"Hard link failed for {src.name}, copying: {e}")
+
+    if hasattr(os, 'copy_file_range'):
+        # In-kernel copy; can share extents (reflink) on filesystems that support it
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = src_stat.st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError as e:
+            # EXDEV/EINVAL/ENOSYS etc. (cross-device, tmpfs, old kernels): use sendfile below
+            logger.debug(f"copy_file_range failed for {src.name}, falling back: {e}")
+
+    shutil.copyfile(src, dst)
+
+
+def _load_and_parse_results(results_file: Path) -> Dict:
+    """Load one result file and parse its metrics (module-level so worker processes can run it)."""
+    results = ReportGenerator.load_benchmark_results(results_file)
+    return ReportGenerator.parse_benchmark_metrics(results, test_name=results_file.stem)
+
+
+def _content_hash(path: Path) -> bytes:
+    """128-bit BLAKE2b digest of a file, hashed from an mmap (no Python-level read)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.blake2b(b'', digest_size=16).digest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.blake2b(mapped, digest_size=16).digest()
+
+
+def _parse_results_files(results_files: List[Path]) -> List[Dict]:
+    """
+    Load and parse result files, preserving order.
+
+    Files are keyed by content hash: files parsed earlier in this process, or with the
+    same content as another file in the list, are served from _PARSED_RESULTS_CACHE
+    and only the remaining unique contents are parsed.
+    """
+    with ThreadPoolExecutor(max_workers=FILE_IO_WORKERS) as executor:
+        keys = list(executor.map(_content_hash, results_files))
+
+    # One file per uncached content hash
+    misses = {}
+    for key, results_file in zip(keys, results_files):
+        if key not in _PARSED_RESULTS_CACHE and key not in misses:
+            misses[key] = results_file
+
+    if misses:
+        parsed = _parse_results_files_concurrently(list(misses.values()))
+        for (key, results_file), metrics in zip(misses.items(), parsed):
+            _PARSED_RESULTS_CACHE[key] = {
+                section: values[results_file.stem] for section, values in metrics.items()
+            }
+    logger.debug(f"Parsed {len(misses)} of {len(results_files)} result file(s), rest cached")
+
+    results = []
+    for key, results_file in zip(keys, results_files):
+        _PARSED_RESULTS_CACHE.move_to_end(key)
+        results.append({
+            section: {results_file.stem: dict(values)}
+            for section, values in _PARSED_RESULTS_CACHE[key].items()
+        })
+
+    while len(_PARSED_RESULTS_CACHE) > PARSED_RESULTS_CACHE_SIZE:
+        _PARSED_RESULTS_CACHE.popitem(last=False)
+
+    return results
+
+
+def _process_pool(num_tasks: int) -> ProcessPoolExecutor:
+    """Process pool with at most one worker per task and per CPU."""
+    # forkserver/spawn rather than fork: the orchestrator has background threads running
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(
+        max_workers=min(num_tasks, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context(start_method)
+    )
+
+
+def _parse_results_files_concurrently(results_files: List[Path]) -> List[Dict]:
+    """
+    Load and parse result files concurrently, preserving order.
+
+    Large reports are spread over worker processes, since JSON decoding holds the GIL;
+    small ones use threads, which only overlap the file reads.
+    """
+    if len(results_files) >= PROCESS_PARSE_MIN_FILES:
+        try:
+            with _process_pool(len(results_files)) as executor:
+                return list(executor.map(_load_and_parse_results, results_files, chunksize=4))
+        except Exception as e:
+            logger.warning(f"Parallel result parsing failed, falling back to threads: {e}")
+
+    with ThreadPoolExecutor(max_workers=FILE_IO_WORKERS) as executor:
+        return list(executor.map(_load_and_parse_results, results_files))
+
+
+@functools.lru_cache(maxsize=None)
+def _omb_chart_generator() -> Optional[Callable]:
+    """omb_charts.generate_all_charts, or None if the module is unavailable."""
+    try:
+        from omb_charts import generate_all_charts
+    except ImportError:
+        logger.warning("omb_charts module not available - chart generation disabled")
+        return None
+    return generate_all_charts
+
+
+@functools.lru_cache(maxsize=None)
+def _interactive_chart_generator() -> Optional[Callable]:
+    """interactive_charts.generate_all_interactive_charts, or None if the module is unavailable."""
+    try:
+        from interactive_charts import generate_all_interactive_charts
+    except ImportError:
+        logger.warning("interactive_charts module not available - interactive chart generation disabled")
+        return None
+    return generate_all_interactive_charts
+
+
+def _interactive_charts_for_file(
+    results_file: Path,
+    plot_data_file: Optional[Path],
+    charts_dir: Path,
+    x_match_group: str
+) -> Tuple[List[Path], Optional[str]]:
+    """
+    Generate one result file's interactive charts.
+
+    Errors are returned rather than raised or logged, so a failing test doesn't stop the
+    others and the message reaches the parent process's log when run in a worker.
+    """
+    try:
+        generated = _interactive_chart_generator()(
+            results_file,
+            plot_data_file,
+            charts_dir,
+            results_file.stem,
+            x_match_group=x_match_group  # Pass match group for sync
+        )
+        return generated, None
+    except Exception as e:
+        return [], str(e)
+
+
+def _generate_interactive_charts(
+    results_files: List[Path],
+    plot_data_file: Optional[Path],
+    charts_dir: Path,
+    x_match_group: str
+) -> List[Tuple[List[Path], Optional[str]]]:
+    """
+    Generate interactive charts for each result file, preserving order.
+
+    Each file's charts are independent, so larger reports spread them over worker
+    processes; smaller ones (or a failed pool) generate them in this process.
+    """
+    args = (results_files, repeat(plot_data_file), repeat(charts_dir), repeat(x_match_group))
+    if len(results_files) >= PROCESS_CHART_MIN_FILES:
+        try:
+            with _process_pool(len(results_files)) as executor:
+                return list(executor.map(_interactive_charts_for_file, *args))
+        except Exception as e:
+            logger.warning(f"Parallel chart generation failed, generating serially: {e}")
+
+    return list(map(_interactive_charts_for_file, *args))
+
+
+class _SummaryAccumulator:
+    """
+    Running summary statistics, updated one test at a time.
+
+    Lets create_report_package compute the summary while merging each test's metrics
+    instead of re-walking the merged metrics afterwards.
+    """
+
+    def __init__(self):
+        # Per-test values are kept so the means use sum()'s compensated float summation
+        self.avg_throughputs: List[float] = []
+        self.p99_latencies: List[float] = []
+        self.peak_throughput = None
+        self.total_errors = 0
+
+    def add(self, throughput: Dict, latency: Dict, errors: Dict) -> None:
+        """Add one test's throughput, latency and error metrics."""
+        self.avg_throughputs.append(throughput.get('publish_rate', 0))
+        peak = throughput.get('max_publish_rate', 0)
+        if self.peak_throughput is None or peak > self.peak_throughput:
+            self.peak_throughput = peak
+        self.p99_latencies.append(latency.get('p99', 0))
+        self.total_errors += errors.get('publish_errors', 0) + errors.get('consume_errors', 0)
+
+    def summary(self) -> Dict:
+        """Summary dict in the format returned by ReportGenerator.calculate_summary_stats."""
+        total_tests = len(self.avg_throughputs)
+        summary = {
+            'total_tests': total_tests,
+            'avg_throughput': 0.0,
+            'peak_throughput': 0.0,
+            'avg_p99_latency': 0.0,
+            'total_errors': self.total_errors
+        }
+        if total_tests:
+            # Overall average throughput: mean of all per-test averages
+            summary['avg_throughput'] = sum(self.avg_throughputs) / total_tests
+            # Peak throughput: highest instantaneous rate across all tests
+            summary['peak_throughput'] = self.peak_throughput
+            summary['avg_p99_latency'] = sum(self.p99_latencies) / total_tests
+        return summary
+
 
 class ReportGenerator:
     """Generate comprehensive experiment reports"""
@@ -41,21 +416,22 @@ class ReportGenerator:
         """Initialize report generator"""
         self.experiment_dir = experiment_dir
         self.experiment_id = experiment_id or experiment_dir.name
+        # One timestamp per report package, shared by index.html and overview.md
+        self.generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         # Only load Jinja2 templates if template directory exists
-        if TEMPLATE_DIR.exists():
-            self.env = Environment(loader=FileSystemLoader(str(TEMPLATE_DIR)))
-        else:
-            self.env = None
+        self.env = _get_template_env()
+        if self.env is None:
             logger.warning(f"Template directory not found: {TEMPLATE_DIR}")
 
-    def load_benchmark_results(self, results_file: Path) -> Dict:
+    @staticmethod
+    def load_benchmark_results(results_file: Path) -> Dict:
         """Load benchmark results from JSON file"""
         logger.info(f"Loading benchmark results from {results_file}")
 
-        with open(results_file, 'r') as f:
-            return json.load(f)
+        return load_json(results_file)
 
-    def parse_benchmark_metrics(self, results: Dict, test_name: str = "test") -> Dict:
+    @staticmethod
+    def parse_benchmark_metrics(results: Dict, test_name: str = "test") -> Dict:
         """
         Parse OpenMessaging Benchmark JSON results.
 
@@ -77,10 +453,8 @@ class ReportGenerator:
         publish_rates = results.get('publishRate', [])
         consume_rates = results.get('consumeRate', [])
 
-        avg_publish_rate = sum(publish_rates) / len(publish_rates) if publish_rates else 0
-        avg_consume_rate = sum(consume_rates) / len(consume_rates) if consume_rates else 0
-        max_publish_rate = max(publish_rates) if publish_rates else 0
-        max_consume_rate = max(consume_rates) if consume_rates else 0
+        avg_publish_rate, max_publish_rate = _rate_stats(publish_rates)
+        avg_consume_rate, max_consume_rate = _rate_stats(consume_rates)
 
         metrics['throughput'][test_name] = {
             'publish_rate': avg_publish_rate,
@@ -118,43 +492,12 @@ class ReportGenerator:
             - peak_throughput: Highest instantaneous rate achieved in any test
             - avg_p99_latency: Mean p99 latency across all tests
         """
-        summary = {
-            'total_tests': len(metrics.get('throughput', {})),
-            'avg_throughput': 0.0,
-            'peak_throughput': 0.0,
-            'avg_p99_latency': 0.0,
-            'total_errors': 0
-        }
-
-        # Collect per-test averages and peaks
-        avg_throughputs = []
-        peak_throughputs = []
-        latencies = []
-
-        for test_name in metrics.get('throughput', {}).keys():
-            avg_throughput = metrics['throughput'][test_name].get('publish_rate', 0)
-            peak_throughput = metrics['throughput'][test_name].get('max_publish_rate', 0)
-            avg_throughputs.append(avg_throughput)
-            peak_throughputs.append(peak_throughput)
-
-            latency = metrics['latency'][test_name].get('p99', 0)
-            latencies.append(latency)
-
-            summary['total_errors'] += metrics['errors'][test_name].get('publish_errors', 0)
-            summary['total_errors'] += metrics['errors'][test_name].get('consume_errors', 0)
-
-        # Overall average throughput: mean of all per-test averages
-        if avg_throughputs:
-            summary['avg_throughput'] = sum(avg_throughputs) / len(avg_throughputs)
-
-        # Peak throughput: highest instantaneous rate across all tests
-        if peak_throughputs:
-            summary['peak_throughput'] = max(peak_throughputs)
-
-        if latencies:
-            summary['avg_p99_latency'] = sum(latencies) / len(latencies)
-
-        return summary
+        latency = metrics.get('latency', {})
+        errors = metrics.get('errors', {})
+        accumulator = _SummaryAccumulator()
+        for test_name, throughput in metrics.get('throughput', {}).items():
+            accumulator.add(throughput, latency[test_name], errors[test_name])
+        return accumulator.summary()
 
     def _group_charts_by_stage(self, charts: List[Path]) -> Dict[str, List[Path]]:
         """
@@ -169,9 +512,6 @@ class ReportGenerator:
         Returns:
             Dict mapping stage name to list of chart paths, sorted by stage number
         """
-        from collections import defaultdict
-        import re
-
         grouped = defaultdict(list)
 
         for chart in charts:
@@ -180,21 +520,20 @@ class ReportGenerator:
             filename = chart.stem  # filename without extension
 
             # Try to extract stage name (everything before " - " or before last underscore if no " - ")
-            if ' - ' in filename:
-                stage_name = filename.split(' - ')[0].strip()
-            elif '_' in filename:
-                # Fallback: use everything before the last underscore
-                parts = filename.rsplit('_', 1)
-                stage_name = parts[0] if len(parts) > 1 else filename
+            head, sep, _ = filename.partition(' - ')
+            if sep:
+                stage_name = head.strip()
             else:
-                stage_name = filename
+                # Fallback: use everything before the last underscore
+                head, sep, _ = filename.rpartition('_')
+                stage_name = head if sep else filename
 
             grouped[stage_name].append(chart)
 
         # Sort stages by their numeric prefix (e.g., "001-rate-100k" before "002-rate-140k")
         def stage_sort_key(stage_name: str):
             # Try to extract leading number
-            match = re.match(r'^(\d+)', stage_name)
+            match = _STAGE_NUMBER_RE.match(stage_name)
             if match:
                 return (int(match.group(1)), stage_name)
             return (999, stage_name)
@@ -203,35 +542,36 @@ class ReportGenerator:
 
         return sorted_grouped
 
-    def generate_html_report(
+    def copy_static_assets(self, output_dir: Path) -> None:
+        """Copy the report stylesheet next to the generated index.html"""
+        css_file = STATIC_DIR / REPORT_CSS
+        if css_file.exists():
+            shutil.copyfile(css_file, output_dir / REPORT_CSS)
+        else:
+            logger.warning(f"Report stylesheet not found: {css_file}")
+
+    def _build_report_context(
         self,
         metrics: Dict,
         cost_data: Optional[Dict] = None,
         config: Optional[Dict] = None,
         charts: Optional[List[Path]] = None,
-        grafana_dashboards: Optional[Dict[str, str]] = None
-    ) -> str:
-        """Generate HTML report using Jinja2 templates"""
-        if not self.env:
-            raise RuntimeError("Jinja2 templates not available")
-
-        logger.info("Generating HTML report")
-
-        # Calculate summary stats
-        summary = self.calculate_summary_stats(metrics)
+        grafana_dashboards: Optional[Dict[str, str]] = None,
+        summary: Optional[Dict] = None
+    ) -> Dict:
+        """Build the Jinja2 template context for the HTML report"""
+        # Calculate summary stats unless the caller already has them
+        if summary is None:
+            summary = self.calculate_summary_stats(metrics)
 
         # Sort test names by stage number (e.g., "001-rate-100k" before "002-rate-140k")
-        sorted_test_names = sorted(
-            metrics.get('throughput', {}).keys(),
-            key=lambda x: (int(x.split('-')[0]) if x.split('-')[0].isdigit() else 999, x)
-        )
+        sorted_test_names = sorted(metrics.get('throughput', {}).keys(), key=_test_sort_key)
 
         # Group charts by stage for organized display
         charts_by_stage = self._group_charts_by_stage(charts or [])
 
-        # Prepare template context
-        context = {
-            'generated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        return {
+            'generated_at': self.generated_at,
             'experiment_dir': str(self.experiment_dir),
             'summary': summary,
             'metrics': metrics,
@@ -243,35 +583,69 @@ class ReportGenerator:
             'grafana_dashboards': grafana_dashboards or {},
         }
 
+    def generate_html_report(
+        self,
+        metrics: Dict,
+        cost_data: Optional[Dict] = None,
+        config: Optional[Dict] = None,
+        charts: Optional[List[Path]] = None,
+        grafana_dashboards: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Generate HTML report using Jinja2 templates"""
+        if not self.env:
+            raise RuntimeError("Jinja2 templates not available")
+
+        logger.info("Generating HTML report")
+
+        context = self._build_report_context(metrics, cost_data, config, charts, grafana_dashboards)
+
         # Render template
         template = self.env.get_template('report.html')
         return template.render(**context)
 
+    def write_html_report(
+        self,
+        output_file: Path,
+        metrics: Dict,
+        cost_data: Optional[Dict] = None,
+        config: Optional[Dict] = None,
+        charts: Optional[List[Path]] = None,
+        grafana_dashboards: Optional[Dict[str, str]] = None,
+        summary: Optional[Dict] = None
+    ) -> None:
+        """
+        Render the HTML report straight to a file.
+
+        Template output is streamed in batches of TEMPLATE_STREAM_BATCH events, each
+        encoded into a large binary write buffer, so the full report is never
+        materialized as one string. Pass summary to reuse already-computed summary stats.
+        """
+        if not self.env:
+            raise RuntimeError("Jinja2 templates not available")
+
+        logger.info(f"Generating HTML report: {output_file}")
+
+        context = self._build_report_context(metrics, cost_data, config, charts, grafana_dashboards, summary)
+
+        template = self.env.get_template('report.html')
+        stream = template.stream(**context)
+        stream.enable_buffering(TEMPLATE_STREAM_BATCH)
+        with _atomic_open(output_file, buffering=WRITE_BUFFER_SIZE) as f:
+            stream.dump(f, encoding='utf-8')
+
     def generate_csv_export(self, metrics: Dict, output_file: Path) -> None:
         """Export metrics to CSV"""
         logger.info(f"Generating CSV export: {output_file}")
 
-        # Convert metrics to DataFrame
-        rows = []
-        for test_name in metrics.get('throughput', {}).keys():
-            row = {
-                'test_name': test_name,
-                'avg_publish_rate_msgs_sec': metrics['throughput'][test_name].get('publish_rate', 0),
-                'max_publish_rate_msgs_sec': metrics['throughput'][test_name].get('max_publish_rate', 0),
-                'avg_consume_rate_msgs_sec': metrics['throughput'][test_name].get('consume_rate', 0),
-                'max_consume_rate_msgs_sec': metrics['throughput'][test_name].get('max_consume_rate', 0),
-                'latency_p50_ms': metrics['latency'][test_name].get('p50', 0),
-                'latency_p95_ms': metrics['latency'][test_name].get('p95', 0),
-                'latency_p99_ms': metrics['latency'][test_name].get('p99', 0),
-                'latency_p999_ms': metrics['latency'][test_name].get('p999', 0),
-                'latency_max_ms': metrics['latency'][test_name].get('max', 0),
-                'publish_errors': metrics['errors'][test_name].get('publish_errors', 0),
-                'consume_errors': metrics['errors'][test_name].get('consume_errors', 0),
-            }
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
-        df.to_csv(output_file, index=False)
+        # One row per test; a few flat columns don't need a DataFrame
+        with _atomic_open(output_file, 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(['test_name'] + [column for column, _, _ in CSV_COLUMNS])
+            sections = [(metrics[section], key) for _, section, key in CSV_COLUMNS]
+            writer.writerows(
+                [test_name] + [section_metrics[test_name].get(key, 0) for section_metrics, key in sections]
+                for test_name in metrics.get('throughput', {})
+            )
 
         logger.info(f"CSV export complete: {output_file}")
 
@@ -279,8 +653,7 @@ class ReportGenerator:
         """Export metrics to JSON"""
         logger.info(f"Generating JSON export: {output_file}")
 
-        with open(output_file, 'w') as f:
-            json.dump(metrics, f, indent=2)
+        _dump_json(metrics, output_file)
 
         logger.info(f"JSON export complete: {output_file}")
 
@@ -306,7 +679,7 @@ class ReportGenerator:
         # Header
         lines.append(f"# Experiment Overview: {self.experiment_id}")
         lines.append("")
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        lines.append(f"Generated: {self.generated_at}")
         lines.append("")
 
         # Cluster Configuration Section
@@ -340,22 +713,20 @@ class ReportGenerator:
         lines.append("|-------|-------------|---------------|-----------|--------|")
 
         workload_configs = all_metrics.get('workload_configs', {})
+        throughput_metrics = all_metrics.get('throughput', {})
 
         # Sort test names by stage number (e.g., "001-rate-100k" before "002-rate-140k")
-        sorted_tests = sorted(
-            all_metrics.get('throughput', {}).keys(),
-            key=lambda x: (int(x.split('-')[0]) if x.split('-')[0].isdigit() else 999, x)
-        )
+        sorted_tests = sorted(throughput_metrics.keys(), key=_test_sort_key)
 
         for test_name in sorted_tests:
             # Get achieved rate (average publish rate)
-            achieved_rate = all_metrics['throughput'][test_name].get('publish_rate', 0)
+            achieved_rate = throughput_metrics[test_name].get('publish_rate', 0)
 
             # Get target rate from workload config
             target_rate = None
-            if test_name in workload_configs:
-                workload = workload_configs[test_name].get('workload', {})
-                target_rate = workload.get('producerRate', None)
+            workload_config = workload_configs.get(test_name)
+            if workload_config is not None:
+                target_rate = workload_config.get('workload', {}).get('producerRate', None)
 
             # Format values and calculate deviation
             achieved_str = f"{achieved_rate:,.0f}"
@@ -414,33 +785,76 @@ class ReportGenerator:
 
         return "\n".join(lines)
 
+    def _load_workload_config(self, workload_file: Path) -> Optional[Dict]:
+        """Load a single workload config file, returning None on failure."""
+        test_name = workload_file.name[:-len('_workload.json')]
+        try:
+            config = load_json(workload_file)
+            logger.info(f"Loaded workload config for {test_name}")
+            return config
+        except Exception as e:
+            logger.warning(f"Failed to load workload config for {test_name}: {e}")
+            return None
+
     def load_workload_configs(self, results_files: List[Path]) -> Dict[str, Dict]:
         """
         Load workload configurations for each test.
 
+        Each results directory is scanned once to find the *_workload.json files,
+        so there is no per-test exists() check; matching files are read concurrently.
+
         Args:
             results_files: List of benchmark result files
 
         Returns:
             Dictionary mapping test names to workload configurations
         """
-        workload_configs = {}
+        # One getdents per results directory: names present in each directory
+        present: Dict[Path, set] = {}
+        for results_dir in {f.parent for f in results_files}:
+            with os.scandir(results_dir) as entries:
+                present[results_dir] = {entry.name for entry in entries}
+
+        # Match each result against its own directory, so equal test names in
+        # different directories don't pick up each other's workload config
+        workload_files = {
+            results_file.stem: results_file.parent / f"{results_file.stem}_workload.json"
+            for results_file in results_files
+            if f"{results_file.stem}_workload.json" in present[results_file.parent]
+        }
 
-        for results_file in results_files:
-            test_name = results_file.stem
-            # Look for workload config file
-            workload_file = results_file.parent / f"{test_name}_workload.json"
+        with ThreadPoolExecutor(max_workers=FILE_IO_WORKERS) as executor:
+            configs = list(executor.map(self._load_workload_config, workload_files.values()))
 
-            if workload_file.exists():
-                try:
-                    with open(workload_file, 'r') as f:
-                        config = json.load(f)
-                        workload_configs[test_name] = config
-                        logger.info(f"Loaded workload config for {test_name}")
-                except Exception as e:
-                    logger.warning(f"Failed to load workload config for {test_name}: {e}")
+        return {
+            test_name: config
+            for test_name, config in zip(workload_files, configs)
+            if config is not None
+        }
 
-        return workload_configs
+    def _write_data_exports(
+        self,
+        report_dir: Path,
+        all_metrics: Dict,
+        cost_data: Optional[Dict] = None,
+        config: Optional[Dict] = None
+    ) -> None:
+        """Write the CSV/JSON metrics exports and the config and cost snapshots"""
+        # Generate CSV export
+        self.generate_csv_export(all_metrics, report_dir / "metrics.csv")
+
+        # Generate JSON export
+        self.generate_json_export(all_metrics, report_dir / "metrics.json")
+
+        # Copy configuration files
+        config_dir = report_dir / "config"
+        config_dir.mkdir(exist_ok=True)
+        if config:
+            _dump_json(config, config_dir / "experiment_config.json")
+
+        # Add cost data
+        if cost_data:
+            _dump_json(cost_data, report_dir / "costs.json")
 
     def create_report_package(
         self,
@@ -448,7 +862,8 @@ class ReportGenerator:
         cost_data: Optional[Dict] = None,
         config: Optional[Dict] = None,
         include_raw_data: bool = True,
-        grafana_dashboards: Optional[Dict[str, str]] = None
+        grafana_dashboards: Optional[Dict[str, str]] = None,
+        preloaded_results: Optional[Dict[str, Dict]] = None
     ) -> Path:
         """
         Create complete offline report package
@@ -459,6 +874,8 @@ class ReportGenerator:
             config: Experiment configuration
             include_raw_data: Include raw benchmark data in package
             grafana_dashboards: Dict of dashboard names to URLs
+            preloaded_results: Already-parsed results keyed by test name; these
+                files are not read from disk again
 
         Returns:
             Path to report package directory
@@ -480,108 +897,114 @@ class ReportGenerator:
             'workload_configs': workload_configs
         }
 
-        for results_file in results_files:
-            # Skip workload config files (they're not benchmark results)
-            if results_file.name.endswith('_workload.json'):
-                continue
-
-            test_name = results_file.stem  # Filename without extension
-            results = self.load_benchmark_results(results_file)
-            metrics = self.parse_benchmark_metrics(results, test_name=test_name)
+        # Skip workload config files (they're not benchmark results)
+        benchmark_files = [f for f in results_files if not f.name.endswith('_workload.json')]
 
-            # Merge metrics
-            for metric_type in ['throughput', 'latency', 'errors']:
-                all_metrics[metric_type].update(metrics[metric_type])
+        # Summary stats are accumulated while merging, for both the HTML report and overview.md
+        summary_accumulator = _SummaryAccumulator()
 
-            # Copy raw data if requested
+        # Copy raw data if requested, in the background while results are parsed
+        with ThreadPoolExecutor(max_workers=FILE_IO_WORKERS) as copy_executor:
+            copies = []
             if include_raw_data:
                 raw_dir = report_dir / "raw_data"
                 raw_dir.mkdir(exist_ok=True)
-                import shutil
-                shutil.copy(results_file, raw_dir / results_file.name)
-
-        # Generate interactive charts with health metrics
-        all_charts = []
-        charts_dir = report_dir / "charts"
-
-        # Use standard Plotly axis matching for synchronized zoom
-        # Note: Plotly's matches parameter only accepts "x", "x2", "y", "y2", etc.
-        x_match_group = "x"
-
-        # Load health metrics if available
-        metrics_dir = self.experiment_dir / "metrics"
-        plot_data_file = metrics_dir / "plot_data.json" if metrics_dir.exists() else None
-
-        # First: Generate OMB charts (from omb_charts.py) - these use pygal or plotly
-        if CHARTS_AVAILABLE and results_files:
-            try:
-                logger.info(f"Generating OMB charts from {len(results_files)} result file(s)...")
-                generated_charts = generate_all_charts(results_files, charts_dir)
-
-                # Convert absolute paths to relative paths for HTML embedding
-                all_charts.extend([chart.relative_to(report_dir) for chart in generated_charts])
-                logger.info(f"Generated {len(generated_charts)} OMB chart(s)")
-            except Exception as e:
-                logger.error(f"OMB chart generation failed: {e}")
-
-        # Second: Generate health + correlation charts (from interactive_charts.py)
-        if INTERACTIVE_CHARTS_AVAILABLE and results_files:
-            try:
-                logger.info(f"Generating health correlation charts from {len(results_files)} result file(s)...")
-
-                for results_file in results_files:
-                    test_name = results_file.stem
-                    generated = generate_all_interactive_charts(
-                        results_file,
-                        plot_data_file,
-                        charts_dir,
-                        test_name,
-                        x_match_group=x_match_group  # Pass match group for sync
-                    )
-                    all_charts.extend([chart.relative_to(report_dir) for chart in generated])
-
-                logger.info(f"Generated health correlation charts with synchronized zoom")
-            except Exception as e:
-                logger.error(f"Health chart generation failed: {e}")
-                logger.exception(e)
-
-        # Generate HTML report
-        html_content = self.generate_html_report(
-            all_metrics,
-            cost_data,
-            config,
-            charts=all_charts,
-            grafana_dashboards=grafana_dashboards
-        )
-        html_file = report_dir / "index.html"
-        with open(html_file, 'w') as f:
-            f.write(html_content)
+                copies = [copy_executor.submit(_copy_raw_result, f, raw_dir / f.name) for f in benchmark_files]
 
-        # Generate CSV export
-        self.generate_csv_export(all_metrics, report_dir / "metrics.csv")
+            # Parse results already in memory directly; load and parse the rest concurrently
+            preloaded_results = preloaded_results or {}
+            files_to_load = [f for f in benchmark_files if f.stem not in preloaded_results]
+            parsed = dict(zip(files_to_load, _parse_results_files(files_to_load)))
 
-        # Generate JSON export
-        self.generate_json_export(all_metrics, report_dir / "metrics.json")
+            for results_file in benchmark_files:
+                test_name = results_file.stem  # Filename without extension
+                if results_file in parsed:
+                    metrics = parsed[results_file]
+                else:
+                    metrics = self.parse_benchmark_metrics(preloaded_results[test_name], test_name=test_name)
+
+                # Merge metrics
+                for metric_type in ['throughput', 'latency', 'errors']:
+                    all_metrics[metric_type].update(metrics[metric_type])
+                summary_accumulator.add(
+                    metrics['throughput'][test_name],
+                    metrics['latency'][test_name],
+                    metrics['errors'][test_name]
+                )
+
+            for future in copies:
+                future.result()
+
+        summary = summary_accumulator.summary()
+
+        # The data exports only read the merged metrics, so write them in the background
+        # while the charts are generated and the HTML report is rendered
+        with ThreadPoolExecutor(max_workers=1) as export_executor:
+            exports = export_executor.submit(self._write_data_exports, report_dir, all_metrics, cost_data, config)
+
+            # Generate interactive charts with health metrics
+            all_charts = []
+            charts_dir = report_dir / "charts"
+
+            # Use standard Plotly axis matching for synchronized zoom
+            # Note: Plotly's matches parameter only accepts "x", "x2", "y", "y2", etc.
+            x_match_group = "x"
+
+            # Load health metrics if available
+            metrics_dir = self.experiment_dir / "metrics"
+            plot_data_file = metrics_dir / "plot_data.json" if metrics_dir.exists() else None
+
+            # First: Generate OMB charts (from omb_charts.py) - these use pygal or plotly
+            generate_all_charts = _omb_chart_generator() if results_files else None
+            if generate_all_charts:
+                try:
+                    logger.info(f"Generating OMB charts from {len(results_files)} result file(s)...")
+                    generated_charts = generate_all_charts(results_files, charts_dir)
 
-        # Copy configuration files
-        config_dir = report_dir / "config"
-        config_dir.mkdir(exist_ok=True)
-        if config:
-            with open(config_dir / "experiment_config.json", 'w') as f:
-                json.dump(config, f, indent=2)
+                    # Convert absolute paths to relative paths for HTML embedding
+                    all_charts.extend([chart.relative_to(report_dir) for chart in generated_charts])
+                    logger.info(f"Generated {len(generated_charts)} OMB chart(s)")
+                except Exception as e:
+                    logger.error(f"OMB chart generation failed: {e}")
 
-        # Add cost data
-        if cost_data:
-            with open(report_dir / "costs.json", 'w') as f:
-                json.dump(cost_data, f, indent=2)
+            # Second: Generate health + correlation charts (from interactive_charts.py)
+            if results_files and _interactive_chart_generator():
+                try:
+                    logger.info(f"Generating health correlation charts from {len(results_files)} result file(s)...")
+
+                    chart_results = _generate_interactive_charts(
+                        results_files, plot_data_file, charts_dir, x_match_group
+                    )
+                    for results_file, (generated, error) in zip(results_files, chart_results):
+                        if error:
+                            logger.error(f"Health chart generation failed for {results_file.stem}: {error}")
+                        all_charts.extend([chart.relative_to(report_dir) for chart in generated])
+
+                    logger.info(f"Generated health correlation charts with synchronized zoom")
+                except Exception as e:
+                    logger.error(f"Health chart generation failed: {e}")
+                    logger.exception(e)
+
+            # Generate HTML report
+            self.write_html_report(
+                report_dir / "index.html",
+                all_metrics,
+                cost_data,
+                config,
+                charts=all_charts,
+                grafana_dashboards=grafana_dashboards,
+                summary=summary
+            )
+            self.copy_static_assets(report_dir)
+
+            exports.result()
 
         # Generate overview.md in experiment root
-        summary = self.calculate_summary_stats(all_metrics)
         cluster_topology = config.get('cluster_topology') if config else None
         overview_md = self.generate_overview_markdown(all_metrics, summary, cluster_topology)
         overview_file = self.experiment_dir / "overview.md"
-        with open(overview_file, 'w') as f:
-            f.write(overview_md)
+        with _atomic_open(overview_file) as f:
+            f.write(overview_md.encode('utf-8'))
         logger.info(f"Overview generated: {overview_file}")
 
         logger.info(f"Report package created: {report_dir}")
@@ -603,10 +1026,8 @@ if __name__ == "__main__":
     results = generator.load_benchmark_results(results_file)
     metrics = generator.parse_benchmark_metrics(results)
 
-    html = generator.generate_html_report(metrics)
     output_file = experiment_dir / "report.html"
-
-    with open(output_file, 'w') as f:
-        f.write(html)
+    generator.write_html_report(output_file, metrics)
+    generator.copy_static_assets(experiment_dir)
 
     print(f"Report generated: {output_file}")
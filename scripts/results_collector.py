@@ -95,8 +95,7 @@ class ResultsCollector:
                 logger.warning(f"Failed to get logs from both current and previous containers")
 
         log_file = self.experiment_dir / f"omb_{test_name}_{'success' if success else 'failed'}.log"
-        with open(log_file, 'w') as f:
-            f.write(logs)
+        log_file.write_text(logs)
         logger.info(f"Logs saved to: {log_file}")
 
         # Extract and save workload configuration
@@ -178,8 +177,7 @@ class ResultsCollector:
                         json.loads(json_data)
 
                         # Save to file
-                        with open(result_file, 'w') as f:
-                            f.write(json_data)
+                        result_file.write_text(json_data)
                         logger.info(f"✓ Extracted {len(json_data)} bytes of JSON from logs to: {result_file}")
                         return json_data
                     else:
@@ -282,8 +280,7 @@ class ResultsCollector:
 
             if result.returncode == 0:
                 log_file = logs_dir / f"{pod_name}.log"
-                with open(log_file, 'w') as f:
-                    f.write(result.stdout)
+                log_file.write_text(result.stdout)
                 logger.debug(f"Saved logs to {log_file}")
             else:
                 logger.warning(f"Failed to get logs from {pod_name}")
@@ -2,8 +2,9 @@
 Terminal UI components for Pulsar OMB Orchestrator.
 """
 
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Optional
 
 from rich.console import Console
 from rich.layout import Layout
@@ -11,6 +12,17 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+# Number of status messages kept (and shown) in the status panel
+STATUS_HISTORY = 20
+
+# Text style for each status message level
+LEVEL_STYLES = {
+    'info': 'white',
+    'success': 'green',
+    'warning': 'yellow',
+    'error': 'red'
+}
+
 
 class OrchestratorUI:
     """Manages terminal UI for orchestrator."""
@@ -20,10 +32,33 @@ class OrchestratorUI:
         self.experiment_id = experiment_id
         self.namespace = namespace
         self.pulsar_tenant_namespace = pulsar_tenant_namespace
-        self.status_messages: List[Dict[str, str]] = []
+        # Bounded so long runs don't accumulate thousands of polling messages
+        self.status_messages: Deque[Dict[str, str]] = deque(maxlen=STATUS_HISTORY)
         self.current_test: Optional[Dict] = None
         self._start_time: Optional[datetime] = None
 
+        # Layout and panels are built once; only a panel's contents are replaced when
+        # its data changes
+        self._metadata_panel = Panel(
+            "",
+            title="[bold cyan]Experiment Info[/bold cyan]",
+            border_style="cyan",
+            padding=(1, 2)
+        )
+        self._status_panel = Panel(
+            "",
+            title="[bold green]Status Log[/bold green]",
+            border_style="green",
+            padding=(1, 2)
+        )
+        self._layout = Layout()
+        self._layout.split_column(
+            Layout(self._metadata_panel, name="top", ratio=1),
+            Layout(self._status_panel, name="bottom", ratio=2)
+        )
+        self._metadata_dirty = True
+        self._status_dirty = True
+
     def add_status(self, message: str, level: str = 'info') -> None:
         """Add a status message to the log."""
         now = datetime.now()
@@ -37,31 +72,43 @@ class OrchestratorUI:
             'message': message,
             'level': level
         })
+        self._status_dirty = True
 
     def set_current_test(self, test: Optional[Dict]) -> None:
         """Set the currently running test."""
         self.current_test = test
+        self._metadata_dirty = True
 
 
     def set_pulsar_namespace(self, namespace: str) -> None:
         """Update the Pulsar tenant/namespace (after detection)."""
         self.pulsar_tenant_namespace = namespace
+        self._metadata_dirty = True
 
-    def create_layout(self) -> Layout:
-        """Create the split-pane layout (horizontal split: metadata on top, status on bottom)."""
-        layout = Layout()
-        layout.split_column(
-            Layout(name="top", ratio=1),
-            Layout(name="bottom", ratio=2)
-        )
-
-        layout["top"].update(self._create_metadata_panel())
-        layout["bottom"].update(self._create_status_panel())
-
-        return layout
+    @property
+    def is_dirty(self) -> bool:
+        """True if any panel's data changed since the last create_layout() call."""
+        return self._metadata_dirty or self._status_dirty
 
-    def _create_metadata_panel(self) -> Panel:
-        """Create static metadata panel."""
+    def create_layout(self) -> Layout:
+        """
+        Return the split-pane layout (horizontal split: metadata on top, status on bottom).
+
+        The same Layout and Panels are returned on every call; only the contents of
+        panels whose data changed since the last call are rebuilt, so frequent
+        live.update() calls stay cheap.
+        """
+        if self._metadata_dirty:
+            self._metadata_panel.renderable = self._create_metadata_content()
+            self._metadata_dirty = False
+        if self._status_dirty:
+            self._status_panel.renderable = self._create_status_content()
+            self._status_dirty = False
+
+        return self._layout
+
+    def _create_metadata_content(self) -> Table:
+        """Create the metadata panel contents."""
         # Experiment info
         exp_table = Table(show_header=False, box=None, padding=(0, 1))
         exp_table.add_column("Key", style="bold cyan", width=18)
@@ -93,42 +140,21 @@ class OrchestratorUI:
         else:
             content = exp_table
 
+        return content
 
-        final_content = content
-
-        return Panel(
-            final_content,
-            title="[bold cyan]Experiment Info[/bold cyan]",
-            border_style="cyan",
-            padding=(1, 2)
-        )
-
-    def _create_status_panel(self) -> Panel:
-        """Create live status panel."""
+    def _create_status_content(self) -> Text:
+        """Create the status log panel contents."""
         if not self.status_messages:
             content = Text("Waiting for test to start...", style="dim italic")
         else:
-            # Show last 20 status messages
+            # Show last STATUS_HISTORY status messages
             content = Text()
-            for msg in self.status_messages[-20:]:
+            for msg in self.status_messages:
                 timestamp = msg.get('time', '')
                 message = msg.get('message', '')
-                level = msg.get('level', 'info')
-
-                style_map = {
-                    'info': 'white',
-                    'success': 'green',
-                    'warning': 'yellow',
-                    'error': 'red'
-                }
-                style = style_map.get(level, 'white')
+                style = LEVEL_STYLES.get(msg.get('level', 'info'), 'white')
 
                 content.append(f"[{timestamp}] ", style="dim")
                 content.append(f"{message}\n", style=style)
 
-        return Panel(
-            content,
-            title="[bold green]Status Log[/bold green]",
-            border_style="green",
-            padding=(1, 2)
-        )
+        return content